@@ -2,13 +2,14 @@
 """CLI for Global Liquidity Tracker."""
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-import pandas as pd
+from src.config import CACHE_DATA_PATH, FRED_API_KEY, get_all_series, get_all_indices
 
-from src.config import FRED_API_KEY, get_all_series, get_all_indices
-from src.etl import DataFetcher, DataStorage
-from src.indicators import Aggregator
+# pandas, the source clients and the indicator stack (statsmodels, sklearn)
+# take about a second to import, so commands import them only when needed
+# and `--help` / `list series` stay fast.
 
 
 def main():
@@ -18,9 +19,18 @@ def main():
     )
     
     subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    # Shared flags for commands that hit upstream sources
+    cache_parser = argparse.ArgumentParser(add_help=False)
+    cache_parser.add_argument("--no-cache", action="store_true",
+                              help="Always fetch from upstream sources")
+    cache_parser.add_argument("--cache-ttl", type=float, default=None,
+                              help="Hours a cached fetch stays fresh, for every range "
+                                   "(default: 24, with closed historical ranges kept 90 days)")
     
     # Fetch command
-    fetch_parser = subparsers.add_parser("fetch", help="Fetch data from sources")
+    fetch_parser = subparsers.add_parser("fetch", help="Fetch data from sources",
+                                         parents=[cache_parser])
     fetch_parser.add_argument("--series", "-s", nargs="+", help="Series IDs to fetch")
     fetch_parser.add_argument("--source", help="Fetch all series from source (fred, bis, worldbank, nyfed)")
     fetch_parser.add_argument("--all", action="store_true", help="Fetch all configured series")
@@ -29,7 +39,8 @@ def main():
     fetch_parser.add_argument("--save", action="store_true", help="Save to storage")
     
     # Compute command
-    compute_parser = subparsers.add_parser("compute", help="Compute composite indices")
+    compute_parser = subparsers.add_parser("compute", help="Compute composite indices",
+                                           parents=[cache_parser])
     compute_parser.add_argument("--index", "-i", nargs="+", help="Index IDs to compute")
     compute_parser.add_argument("--all", action="store_true", help="Compute all indices")
     compute_parser.add_argument("--start", help="Start date (YYYY-MM-DD)")
@@ -43,7 +54,8 @@ def main():
     list_parser.add_argument("type", choices=["series", "indices", "stored"], help="What to list")
     
     # Show command
-    show_parser = subparsers.add_parser("show", help="Show series data")
+    show_parser = subparsers.add_parser("show", help="Show series data",
+                                        parents=[cache_parser])
     show_parser.add_argument("series_id", help="Series ID to show")
     show_parser.add_argument("--start", help="Start date (YYYY-MM-DD)")
     show_parser.add_argument("--end", help="End date (YYYY-MM-DD)")
@@ -95,9 +107,25 @@ def main():
         sys.exit(smoke_main())
 
 
+def make_fetcher(args):
+    """Build a DataFetcher honouring the --no-cache/--cache-ttl flags."""
+    from src.etl import DataFetcher
+
+    if args.no_cache:
+        return DataFetcher()
+    if args.cache_ttl is None:
+        return DataFetcher(cache_path=CACHE_DATA_PATH, cache_ttl=24 * 3600)
+    # An explicit TTL applies to historical ranges too, so --cache-ttl 0
+    # always refetches
+    return DataFetcher(cache_path=CACHE_DATA_PATH, cache_ttl=args.cache_ttl * 3600,
+                       historical_cache_ttl=None)
+
+
 def cmd_fetch(args):
     """Fetch data from sources."""
-    fetcher = DataFetcher()
+    from src.etl import DataStorage
+
+    fetcher = make_fetcher(args)
     storage = DataStorage()
     
     start = args.start or (datetime.now() - timedelta(days=365*3)).strftime("%Y-%m-%d")
@@ -129,7 +157,12 @@ def cmd_fetch(args):
 
 def cmd_compute(args):
     """Compute composite indices."""
-    aggregator = Aggregator()
+    import pandas as pd
+
+    from src.etl import DataStorage
+    from src.indicators import Aggregator
+
+    aggregator = Aggregator(make_fetcher(args))
     storage = DataStorage()
     
     start = args.start or (datetime.now() - timedelta(days=365*3)).strftime("%Y-%m-%d")
@@ -141,52 +174,65 @@ def cmd_compute(args):
     elif args.index:
         print(f"Computing indices: {args.index}")
         results = {}
-        for idx in args.index:
-            try:
-                # Special handling for GLCI with pillars/regime flags
-                if idx == "global_liquidity_credit_index" and (args.pillars or args.regime):
-                    full_result = aggregator.compute_glci(
-                        start, end, 
-                        save=args.save, 
-                        include_pillars=True
-                    )
-                    results[idx] = full_result["glci"]
+        glci_detail = args.pillars or args.regime
+        # Plain indices are independent and mostly wait on upstream fetches,
+        # so start them all on a thread pool and collect them in order below
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            pending = {
+                idx: pool.submit(aggregator.compute_index, idx, start, end)
+                for idx in dict.fromkeys(args.index)
+                if not (idx == "global_liquidity_credit_index" and glci_detail)
+            }
+            for idx in args.index:
+                try:
+                    # Special handling for GLCI with pillars/regime flags
+                    if idx == "global_liquidity_credit_index" and glci_detail:
+                        full_result = aggregator.compute_glci(
+                            start, end, 
+                            save=args.save, 
+                            include_pillars=True
+                        )
+                        results[idx] = full_result["glci"]
                     
-                    # Print pillar info if requested
-                    if args.pillars:
-                        print(f"\n  Pillar breakdown:")
-                        pillars_df = full_result["pillars"]
-                        latest_pillars = pillars_df.iloc[-1]
-                        for col in pillars_df.columns:
-                            if col != "date":
-                                weight = full_result["weights"]["pillar_weights"].get(col, 0)
-                                print(f"    {col}: {latest_pillars[col]:.2f} (weight: {weight:.0%})")
+                        # Print pillar info if requested
+                        if args.pillars:
+                            print(f"\n  Pillar breakdown:")
+                            pillars_df = full_result["pillars"]
+                            pillar_cols = [col for col in pillars_df.columns if col != "date"]
+                            pillar_table = pd.DataFrame({
+                                "value": pillars_df[pillar_cols].to_numpy()[-1],
+                                "weight": pd.Series(full_result["weights"]["pillar_weights"])
+                                .reindex(pillar_cols).fillna(0).to_numpy(),
+                            }, index=pillar_cols)
+                            for col, value, weight in pillar_table.itertuples(name=None):
+                                print(f"    {col}: {value:.2f} (weight: {weight:.0%})")
                     
-                    # Print regime info if requested
-                    if args.regime:
-                        regimes_df = full_result["regimes"]
-                        latest_regime = regimes_df.iloc[-1]
-                        print(f"\n  Current regime: {latest_regime['regime_label']} (zscore: {latest_regime['zscore']:.2f})")
+                        # Print regime info if requested
+                        if args.regime:
+                            regimes_df = full_result["regimes"]
+                            latest_label = regimes_df["regime_label"].to_numpy()[-1]
+                            latest_zscore = regimes_df["zscore"].to_numpy()[-1]
+                            print(f"\n  Current regime: {latest_label} (zscore: {latest_zscore:.2f})")
                         
-                        # Regime distribution
-                        regime_counts = regimes_df["regime_label"].value_counts()
-                        print(f"  Regime distribution:")
-                        for regime, count in regime_counts.items():
-                            pct = count / len(regimes_df) * 100
-                            print(f"    {regime}: {count} periods ({pct:.1f}%)")
-                else:
-                    results[idx] = aggregator.compute_index(idx, start, end)
-            except Exception as e:
-                print(f"  Error computing {idx}: {e}")
-                import traceback
-                traceback.print_exc()
+                            # Regime distribution
+                            regime_counts = regimes_df["regime_label"].value_counts()
+                            regime_pcts = regime_counts.to_numpy() / len(regimes_df) * 100
+                            print(f"  Regime distribution:")
+                            for regime, count, pct in zip(regime_counts.index, regime_counts.to_numpy(), regime_pcts):
+                                print(f"    {regime}: {count} periods ({pct:.1f}%)")
+                    else:
+                        results[idx] = pending[idx].result()
+                except Exception as e:
+                    print(f"  Error computing {idx}: {e}")
+                    import traceback
+                    traceback.print_exc()
     else:
         print("Specify --index or --all")
         return
     
     for index_id, df in results.items():
         if not df.empty:
-            latest = df.iloc[-1]["value"]
+            latest = df["value"].to_numpy()[-1]
             print(f"  {index_id}: {len(df)} observations, latest={latest:,.2f}")
             
             if args.save and index_id != "global_liquidity_credit_index":
@@ -199,9 +245,12 @@ def cmd_compute(args):
 
 def cmd_list(args):
     """List available series/indices."""
+    # Build the listing and write it once: one write call for the whole
+    # catalog instead of a print call per row
+    lines = []
     if args.type == "series":
         all_series = get_all_series()
-        print(f"\nConfigured Series ({len(all_series)}):\n")
+        lines += ["", f"Configured Series ({len(all_series)}):", ""]
         
         # Group by source
         by_source = {}
@@ -212,72 +261,84 @@ def cmd_list(args):
             by_source[source].append((sid, cfg))
         
         for source, items in sorted(by_source.items()):
-            print(f"[{source.upper()}]")
+            lines.append(f"[{source.upper()}]")
             for sid, cfg in items:
                 desc = cfg.get("description", "")[:50]
                 freq = cfg.get("frequency", "?")
-                print(f"  {sid:<30} {freq:<10} {desc}")
-            print()
+                lines.append(f"  {sid:<30} {freq:<10} {desc}")
+            lines.append("")
     
     elif args.type == "indices":
         all_indices = get_all_indices()
-        print(f"\nConfigured Indices ({len(all_indices)}):\n")
+        lines += ["", f"Configured Indices ({len(all_indices)}):", ""]
         
         for idx, cfg in all_indices.items():
             desc = cfg.get("description", "")[:60]
             method = cfg.get("method", "arithmetic")
             n_comp = len(cfg.get("components", []))
-            print(f"  {idx:<25} {method:<15} {n_comp} components")
-            print(f"    {desc}")
-            print()
+            lines.append(f"  {idx:<25} {method:<15} {n_comp} components")
+            lines.append(f"    {desc}")
+            lines.append("")
     
     elif args.type == "stored":
+        from src.etl import DataStorage
+
         storage = DataStorage()
         
-        print("\nStored Raw Data:")
+        lines += ["", "Stored Raw Data:"]
         raw = storage.list_raw_series()
-        for item in raw:
-            print(f"  {item['source']}/{item['series_id']}")
+        lines += [f"  {item['source']}/{item['series_id']}" for item in raw]
         
-        print("\nStored Curated Data:")
+        lines += ["", "Stored Curated Data:"]
         curated = storage.list_curated()
-        for item in curated:
-            print(f"  {item['category']}/{item['name']}")
+        lines += [f"  {item['category']}/{item['name']}" for item in curated]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_show(args):
     """Show series data."""
-    fetcher = DataFetcher()
+    import numpy as np
+    import pandas as pd
+
+    fetcher = make_fetcher(args)
     
     start = args.start or (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
     end = args.end or datetime.now().strftime("%Y-%m-%d")
     
     try:
         df = fetcher.fetch_series(args.series_id, start, end)
-        
-        if df.empty:
-            print(f"No data for {args.series_id}")
-            return
-        
-        print(f"\n{args.series_id}")
-        print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-        print(f"Observations: {len(df)}")
-        print()
-        
-        # Show tail
-        display_df = df[["date", "value"]].tail(args.tail)
-        display_df["date"] = display_df["date"].dt.strftime("%Y-%m-%d")
-        print(display_df.to_string(index=False))
-        
-        # Stats
-        print(f"\nStats:")
-        print(f"  Latest: {df['value'].iloc[-1]:,.4f}")
-        print(f"  Min:    {df['value'].min():,.4f}")
-        print(f"  Max:    {df['value'].max():,.4f}")
-        print(f"  Mean:   {df['value'].mean():,.4f}")
-        
     except Exception as e:
         print(f"Error: {e}")
+        return
+
+    if df.empty:
+        print(f"No data for {args.series_id}")
+        return
+
+    print(f"\n{args.series_id}")
+    print(f"Date range: {df['date'].min()} to {df['date'].max()}")
+    print(f"Observations: {len(df)}")
+    print()
+
+    # Show tail
+    tail_df = df.tail(args.tail)
+    display_df = pd.DataFrame({
+        # strftime keeps a tz-aware column's own zone; datetime_as_string
+        # would format the UTC instant and can print the wrong day
+        "date": tail_df["date"].dt.strftime("%Y-%m-%d").to_numpy(),
+        "value": tail_df["value"].to_numpy(),
+    })
+    print(display_df.to_string(index=False))
+
+    # Stats
+    # NaN-skipping like the pandas reductions, but on one shared ndarray
+    values = df["value"].to_numpy(dtype=float)
+    print(f"\nStats:")
+    print(f"  Latest: {values[-1]:,.4f}")
+    print(f"  Min:    {np.nanmin(values):,.4f}")
+    print(f"  Max:    {np.nanmax(values):,.4f}")
+    print(f"  Mean:   {np.nanmean(values):,.4f}")
 
 
 def cmd_backtest(args):
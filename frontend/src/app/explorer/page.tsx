@@ -21,6 +21,7 @@ import {
   TOOLTIP_STYLE,
   formatTickDate,
   formatTooltipDate,
+  thinRows,
 } from "@/lib/chart-theme";
 import { getDateRange, type TimeRange } from "@/lib/utils";
 import type { SeriesInfo } from "@/lib/api";
@@ -141,7 +142,9 @@ export default function ExplorerPage() {
     for (const id of selected) {
       const points = seriesData[id] ?? [];
       const m = new Map<string, number>();
-      for (const p of points) {
+      // Thin per series, not the merged rows, so a monthly series plotted
+      // next to a daily one keeps every observation
+      for (const p of thinRows(points)) {
         m.set(p.date, p.value);
         dates.add(p.date);
       }
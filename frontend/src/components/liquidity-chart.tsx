@@ -1,5 +1,6 @@
 "use client";
 
+import { useMemo } from "react";
 import {
   LineChart,
   Line,
@@ -20,6 +21,7 @@ import {
   TOOLTIP_LABEL_STYLE,
   formatTickDate,
   formatTooltipDate,
+  thinRows,
 } from "@/lib/chart-theme";
 
 /** Compact tick label with a true minus sign for negatives. */
@@ -74,10 +76,12 @@ export function LiquidityChart({
   referenceLine,
   referenceLabel,
 }: LiquidityChartProps) {
+  const chartData = useMemo(() => thinRows(data), [data]);
+
   return (
     <div style={{ height }} className={cn("w-full", className)}>
       <ResponsiveContainer width="100%" height="100%">
-        <LineChart data={data} margin={{ top: 8, right: 8, bottom: 0, left: 0 }}>
+        <LineChart data={chartData} margin={{ top: 8, right: 8, bottom: 0, left: 0 }}>
           {showGrid && <CartesianGrid {...GRID_PROPS} />}
           <XAxis
             dataKey="date"
@@ -1,5 +1,6 @@
 "use client";
 
+import { useMemo } from "react";
 import {
   LineChart,
   Line,
@@ -18,6 +19,7 @@ import {
   TOOLTIP_LABEL_STYLE,
   formatTickDate,
   formatTooltipDate,
+  thinRows,
 } from "@/lib/chart-theme";
 
 interface SeriesConfig {
@@ -74,6 +76,7 @@ export function MultiLineChart({
   normalized = false,
 }: MultiLineChartProps) {
   const format = valueFormatter ?? ((v: number) => (normalized ? v.toFixed(0) : formatCompactTick(v)));
+  const chartData = useMemo(() => thinRows(data), [data]);
 
   return (
     <div className={cn("space-y-2", className)}>
@@ -93,7 +96,7 @@ export function MultiLineChart({
       )}
       <div style={{ height }} className="w-full">
         <ResponsiveContainer width="100%" height="100%">
-          <LineChart data={data} margin={{ top: 8, right: 8, bottom: 0, left: 0 }}>
+          <LineChart data={chartData} margin={{ top: 8, right: 8, bottom: 0, left: 0 }}>
             {showGrid && <CartesianGrid {...GRID_PROPS} />}
             <XAxis
               dataKey="date"
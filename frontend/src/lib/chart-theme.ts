@@ -59,3 +59,19 @@ export function formatTooltipDate(date: string): string {
   if (Number.isNaN(d.getTime())) return date;
   return d.toLocaleDateString("en-US", { month: "short", day: "numeric", year: "numeric" });
 }
+
+/** More points than a chart has horizontal pixels only costs SVG path work. */
+export const MAX_CHART_POINTS = 1500;
+
+/**
+ * Stride-thin date-ordered rows to at most `maxPoints`, always keeping the
+ * final row so the latest print stays on the chart.
+ */
+export function thinRows<T>(rows: T[], maxPoints: number = MAX_CHART_POINTS): T[] {
+  if (rows.length <= maxPoints) return rows;
+  const step = Math.ceil(rows.length / maxPoints);
+  const out: T[] = [];
+  for (let i = 0; i < rows.length; i += step) out.push(rows[i]);
+  if (out[out.length - 1] !== rows[rows.length - 1]) out.push(rows[rows.length - 1]);
+  return out;
+}
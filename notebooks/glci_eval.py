@@ -21,19 +21,57 @@ sys.path.insert(0, str(project_root))
 import pandas as pd
 import numpy as np
 
-# Check for matplotlib
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    print("Warning: matplotlib not available. Install with: pip install matplotlib")
-
 from src.indicators import GLCIComputer, Aggregator, compute_glci
 from src.etl import DataFetcher, DataStorage
 
 
+def aligned_correlation(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    min_overlap: int = 11
+) -> float | None:
+    """Pearson correlation of two date/value frames over their shared dates.
+
+    Aligns on the (already sorted) date index instead of hash-merging, and
+    correlates the raw arrays. Returns None below ``min_overlap`` dates.
+    """
+    a, b = left.set_index("date")["value"].align(
+        right.set_index("date")["value"], join="inner"
+    )
+    if len(a) < min_overlap:
+        return None
+    a_values = a.to_numpy(dtype=float)
+    b_values = b.to_numpy(dtype=float)
+    # Pairwise-complete observations, matching Series.corr
+    both = np.isfinite(a_values) & np.isfinite(b_values)
+    if both.sum() < 2:
+        return None
+    return float(np.corrcoef(a_values[both], b_values[both])[0, 1])
+
+
+def stress_episode_stats(
+    glci_df: pd.DataFrame,
+    episodes: list[tuple[str, str, str]],
+) -> pd.DataFrame:
+    """Size/min/max/mean of GLCI values inside each ``(name, start, end)`` window.
+
+    Tags every row with its episode in one pass, then aggregates per
+    episode. Episodes outside the sample are kept with size 0.
+    """
+    dates = glci_df["date"]
+    # pd.cut needs bins in the same datetime unit as the dates
+    windows = pd.IntervalIndex.from_arrays(
+        pd.to_datetime([start for _, start, _ in episodes]).as_unit(dates.dt.unit),
+        pd.to_datetime([end for _, _, end in episodes]).as_unit(dates.dt.unit),
+        closed="both",
+    )
+    stats = glci_df["value"].groupby(pd.cut(dates, windows), observed=False).agg(
+        ["size", "min", "max", "mean"]
+    )
+    stats.index = [name for name, _, _ in episodes]
+    return stats
+
+
 def compute_and_evaluate(
     start_date: str | None = None,
     end_date: str | None = None,
@@ -78,9 +116,11 @@ def compute_and_evaluate(
     # 3. Regime Analysis
     print("\n3. Regime Analysis:")
     regime_stats = regimes_df["regime_label"].value_counts()
-    for regime, count in regime_stats.items():
-        pct = count / len(regimes_df) * 100
-        print(f"   {regime:>8}: {count:>4} periods ({pct:>5.1f}%)")
+    regime_pcts = regime_stats.to_numpy() / len(regimes_df) * 100
+    print("\n".join(
+        f"   {regime:>8}: {count:>4} periods ({pct:>5.1f}%)"
+        for regime, count, pct in zip(regime_stats.index, regime_stats.to_numpy(), regime_pcts)
+    ))
     
     # Current regime
     current_regime = regimes_df.iloc[-1]["regime_label"]
@@ -89,15 +129,18 @@ def compute_and_evaluate(
     
     # 4. Pillar Contributions
     print("\n4. Pillar Contributions (latest):")
-    pillar_weights = result.weights["pillar_weights"]
-    latest_pillars = pillars_df.iloc[-1]
-    
-    for pillar in ["liquidity", "credit", "stress"]:
-        if pillar in pillars_df.columns:
-            value = latest_pillars[pillar]
-            weight = pillar_weights.get(pillar, 0)
-            contribution = value * weight
-            print(f"   {pillar:>12}: value={value:>7.2f}, weight={weight:.0%}, contrib={contribution:>7.2f}")
+    pillar_cols = [pillar for pillar in ["liquidity", "credit", "stress"] if pillar in pillars_df.columns]
+    pillar_table = pd.DataFrame({
+        "value": pillars_df[pillar_cols].to_numpy()[-1],
+        "weight": pd.Series(result.weights["pillar_weights"])
+        .reindex(pillar_cols).fillna(0).to_numpy(),
+    }, index=pillar_cols)
+    pillar_table["contribution"] = pillar_table["value"] * pillar_table["weight"]
+
+    print("\n".join(
+        f"   {pillar:>12}: value={value:>7.2f}, weight={weight:.0%}, contrib={contribution:>7.2f}"
+        for pillar, value, weight, contribution in pillar_table.itertuples(name=None)
+    ))
     
     # 5. Correlation with existing indices
     print("\n5. Correlation with Other Indices:")
@@ -106,15 +149,8 @@ def compute_and_evaluate(
     try:
         fed_liq = aggregator.compute_index("fed_net_liquidity", start_date, end_date)
         if not fed_liq.empty:
-            # Align dates
-            merged = pd.merge(
-                glci_df[["date", "value"]].rename(columns={"value": "glci"}),
-                fed_liq[["date", "value"]].rename(columns={"value": "fed_liq"}),
-                on="date",
-                how="inner"
-            )
-            if len(merged) > 10:
-                corr = merged["glci"].corr(merged["fed_liq"])
+            corr = aligned_correlation(glci_df, fed_liq)
+            if corr is not None:
                 print(f"   GLCI vs Fed Net Liquidity: {corr:.3f}")
     except Exception as e:
         print(f"   Could not compute Fed Net Liquidity correlation: {e}")
@@ -122,14 +158,8 @@ def compute_and_evaluate(
     try:
         stress = aggregator.compute_index("usd_funding_stress", start_date, end_date)
         if not stress.empty:
-            merged = pd.merge(
-                glci_df[["date", "value"]].rename(columns={"value": "glci"}),
-                stress[["date", "value"]].rename(columns={"value": "stress"}),
-                on="date",
-                how="inner"
-            )
-            if len(merged) > 10:
-                corr = merged["glci"].corr(merged["stress"])
+            corr = aligned_correlation(glci_df, stress)
+            if corr is not None:
                 print(f"   GLCI vs USD Credit Stress: {corr:.3f}")
     except Exception as e:
         print(f"   Could not compute Credit Stress correlation: {e}")
@@ -142,27 +172,25 @@ def compute_and_evaluate(
         ("2022 QT/Rate Hikes", "2022-01-01", "2022-12-31"),
     ]
     
-    for name, ep_start, ep_end in stress_episodes:
-        mask = (glci_df["date"] >= ep_start) & (glci_df["date"] <= ep_end)
-        episode_data = glci_df[mask]
-        
-        if len(episode_data) > 0:
-            min_val = episode_data["value"].min()
-            max_val = episode_data["value"].max()
-            mean_val = episode_data["value"].mean()
-            print(f"   {name}:")
-            print(f"     Min: {min_val:.1f}, Max: {max_val:.1f}, Mean: {mean_val:.1f}")
+    episode_stats = stress_episode_stats(glci_df, stress_episodes)
+    
+    episode_lines = []
+    for name, size, min_val, max_val, mean_val in episode_stats.itertuples(name=None):
+        if size > 0:
+            episode_lines.append(f"   {name}:")
+            episode_lines.append(f"     Min: {min_val:.1f}, Max: {max_val:.1f}, Mean: {mean_val:.1f}")
         else:
-            print(f"   {name}: No data available")
+            episode_lines.append(f"   {name}: No data available")
+    print("\n".join(episode_lines))
     
     # 7. Generate Plots
-    if HAS_MATPLOTLIB and save_plots:
+    if save_plots:
         print("\n7. Generating Plots...")
         plot_dir = project_root / "data" / "curated" / "plots"
         plot_dir.mkdir(parents=True, exist_ok=True)
         
-        generate_plots(glci_df, pillars_df, regimes_df, result.weights, plot_dir)
-        print(f"   Plots saved to {plot_dir}")
+        if generate_plots(glci_df, pillars_df, regimes_df, result.weights, plot_dir):
+            print(f"   Plots saved to {plot_dir}")
     
     # 8. Summary
     print("\n" + "=" * 60)
@@ -184,10 +212,30 @@ def generate_plots(
     regimes_df: pd.DataFrame,
     weights: dict,
     output_dir: Path
-):
-    """Generate evaluation plots."""
-    if not HAS_MATPLOTLIB:
-        return
+) -> bool:
+    """Generate evaluation plots.
+
+    matplotlib is imported here rather than at module load, so runs
+    without --save-plots never pay for it.
+
+    Returns:
+        False if matplotlib is not installed, True once plots are written
+    """
+    try:
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+    except ImportError:
+        print("   Warning: matplotlib not available. Install with: pip install matplotlib")
+        return False
+    
+    # Dates come out of GLCIComputer as datetime64 already; only coerce
+    # when handed something else (e.g. frames reloaded from JSON)
+    glci_dates = glci_df["date"]
+    if not pd.api.types.is_datetime64_any_dtype(glci_dates):
+        glci_dates = pd.to_datetime(glci_dates)
+    pillar_dates = pillars_df["date"]
+    if not pd.api.types.is_datetime64_any_dtype(pillar_dates):
+        pillar_dates = pd.to_datetime(pillar_dates)
     
     # Set style
     plt.style.use("seaborn-v0_8-whitegrid")
@@ -195,19 +243,25 @@ def generate_plots(
     # 1. GLCI Time Series with Regimes
     fig, ax = plt.subplots(figsize=(14, 6))
     
-    dates = pd.to_datetime(glci_df["date"])
+    dates = glci_dates
     values = glci_df["value"]
     
     ax.plot(dates, values, "b-", linewidth=1.5, label="GLCI")
     ax.axhline(y=100, color="gray", linestyle="--", alpha=0.5)
     
-    # Shade regimes
-    regimes = regimes_df["regime"].values
-    for i in range(len(dates) - 1):
-        if regimes[i] == 1:  # Loose
-            ax.axvspan(dates.iloc[i], dates.iloc[i+1], alpha=0.2, color="green")
-        elif regimes[i] == -1:  # Tight
-            ax.axvspan(dates.iloc[i], dates.iloc[i+1], alpha=0.2, color="red")
+    # Shade regimes: one span per contiguous run rather than per observation.
+    # Each run is shaded up to the first date of the next run, as before.
+    regimes = regimes_df["regime"].to_numpy()
+    run_starts = np.concatenate(([0], np.flatnonzero(regimes[1:] != regimes[:-1]) + 1))
+    run_ends = np.append(run_starts[1:], len(regimes))
+    for start, end in zip(run_starts, run_ends):
+        stop = min(end, len(dates) - 1)
+        if start >= stop:
+            continue
+        if regimes[start] == 1:  # Loose
+            ax.axvspan(dates.iloc[start], dates.iloc[stop], alpha=0.2, color="green")
+        elif regimes[start] == -1:  # Tight
+            ax.axvspan(dates.iloc[start], dates.iloc[stop], alpha=0.2, color="red")
     
     ax.set_title("Global Liquidity & Credit Index (GLCI)", fontsize=14)
     ax.set_xlabel("Date")
@@ -222,7 +276,7 @@ def generate_plots(
     # 2. Pillar Contributions
     fig, axes = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
     
-    dates = pd.to_datetime(pillars_df["date"])
+    dates = pillar_dates
     pillar_names = ["liquidity", "credit", "stress"]
     colors = ["blue", "green", "red"]
     
@@ -253,8 +307,8 @@ def generate_plots(
     ax.set_xlabel("Regime")
     ax.set_ylabel("Number of Periods")
     
-    for i, (regime, count) in enumerate(regime_counts.items()):
-        pct = count / len(regimes_df) * 100
+    regime_pcts = regime_counts.to_numpy() / len(regimes_df) * 100
+    for i, (count, pct) in enumerate(zip(regime_counts.to_numpy(), regime_pcts)):
         ax.text(i, count + 5, f"{pct:.1f}%", ha="center")
     
     plt.tight_layout()
@@ -262,6 +316,7 @@ def generate_plots(
     plt.close()
     
     print("   Generated: glci_timeseries.png, glci_pillars.png, glci_regimes.png")
+    return True
 
 
 def main():
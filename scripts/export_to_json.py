@@ -23,13 +23,18 @@ Optional snapshots can be copied to snapshots/YYYY-MM-DD for long-cache hosting.
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
+import os
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 
 # Ensure repository root is on sys.path for module imports when run in CI
@@ -94,6 +99,14 @@ CATEGORY_MAP: Dict[str, str] = {
 }
 
 REGIME_LABELS = {-1: "tight", 0: "neutral", 1: "loose"}
+
+# Artifacts are machine-consumed, and pretty-printing roughly doubles both
+# encode time and bytes on the large history endpoints. --pretty restores
+# indented output for debugging.
+JSON_INDENT: int | None = None
+# --gzip also writes a precompressed index.json.gz beside each index.json,
+# for hosts that serve it with Content-Encoding: gzip.
+JSON_GZIP = False
 REQUIRED_SECTOR_TICKERS = {
     "XLB",
     "XLC",
@@ -148,10 +161,84 @@ def fmt_date(value: Any) -> str:
     return str(value)[:10]
 
 
+def fmt_dates(values: Any) -> List[str]:
+    """Vectorized :func:`fmt_date` for a whole date column.
+
+    Parses and formats the column in one pass instead of one ``strftime``
+    per row; missing dates become ``""``. The column-wide parse infers one
+    format from the first string, so any value it misses is handed to
+    :func:`fmt_date` and comes out exactly as the scalar formatter would
+    write it.
+    """
+    values = pd.Series(values)
+    dates = pd.to_datetime(values, errors="coerce")
+    # Not np.datetime_as_string: it renders tz-aware columns in UTC, which
+    # can shift the calendar day, and writes missing dates as "NaT"
+    formatted = dates.dt.strftime("%Y-%m-%d").astype(object)
+    missed = dates.isna() & values.notna()
+    if missed.any():
+        formatted[missed] = values[missed].map(fmt_date)
+    return formatted.fillna("").tolist()
+
+
+def build_data_points(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """``[{"date", "value"}, ...]`` for the rows of ``df`` with a value.
+
+    Dates are formatted and values converted column-wise, so no per-row
+    Series is built; rows with a missing value are omitted.
+    """
+    observed = df["value"].notna().to_numpy()
+    dates = fmt_dates(df.loc[observed, "date"])
+    values = df.loc[observed, "value"].astype(float).tolist()
+    return [{"date": d, "value": v} for d, v in zip(dates, values)]
+
+
+def round_column(values: Any, decimals: int, missing: Any = None) -> List[Any]:
+    """Round a numeric column to plain floats, with ``missing`` for NaN.
+
+    The NaN mask is computed in one numpy pass. Rounding stays with
+    Python's correctly rounded ``round()``: numpy and pandas round by
+    scaling, which moves some halfway values (5.555 -> 5.56) and would
+    change published figures.
+    """
+    array = np.asarray(values, dtype=float)
+    present = (~np.isnan(array)).tolist()
+    return [
+        round(value, decimals) if ok else missing
+        for value, ok in zip(array.tolist(), present)
+    ]
+
+
+def ensure_sorted(df: pd.DataFrame, column: str = "date") -> pd.DataFrame:
+    """Return ``df`` ordered by ``column``, skipping the sort when it already is.
+
+    Stored series are almost always written in date order, so the O(n)
+    monotonic check usually saves an O(n log n) sort and a frame copy.
+    """
+    if df[column].is_monotonic_increasing:
+        return df
+    return df.sort_values(column)
+
+
 def write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(payload, f, indent=2, default=str)
+    # Encode in one shot and write once. Compact output also drops the
+    # spaces after "," and ":"; payloads are freshly built trees, so the
+    # encoder's cycle bookkeeping is skipped.
+    separators = (",", ":") if JSON_INDENT is None else None
+    encoded = json.dumps(
+        payload,
+        indent=JSON_INDENT,
+        separators=separators,
+        default=str,
+        check_circular=False,
+    ).encode("utf-8")
+    path.write_bytes(encoded)
+    if JSON_GZIP:
+        # mtime=0 keeps the archive byte-identical when the JSON is unchanged
+        path.with_name(path.name + ".gz").write_bytes(
+            gzip.compress(encoded, compresslevel=6, mtime=0)
+        )
 
 
 def export_series_list(
@@ -159,20 +246,19 @@ def export_series_list(
     output_dir: Path,
     exported_series_ids: set[str] | None = None,
 ) -> None:
-    items = []
-    for series_id, cfg in series_cfg.items():
-        if exported_series_ids is not None and series_id not in exported_series_ids:
-            continue
-        items.append(
-            {
-                "id": series_id,
-                "name": cfg.get("description", series_id),
-                "source": cfg.get("source", "unknown").upper(),
-                "category": CATEGORY_MAP.get(series_id, "Other"),
-                "frequency": cfg.get("frequency", "unknown"),
-                "unit": cfg.get("unit", ""),
-            }
-        )
+    category_of = CATEGORY_MAP.get
+    items = [
+        {
+            "id": series_id,
+            "name": cfg.get("description", series_id),
+            "source": cfg.get("source", "unknown").upper(),
+            "category": category_of(series_id, "Other"),
+            "frequency": cfg.get("frequency", "unknown"),
+            "unit": cfg.get("unit", ""),
+        }
+        for series_id, cfg in series_cfg.items()
+        if exported_series_ids is None or series_id in exported_series_ids
+    ]
     write_json(output_dir / "api" / "series" / "index.json", items)
 
 
@@ -180,16 +266,12 @@ def export_single_series(
     storage: DataStorage, series_id: str, cfg: dict, output_dir: Path
 ) -> bool:
     source = cfg.get("source")
-    df = storage.load_raw(source, series_id)
+    df = storage.load_raw(source, series_id, columns=["date", "value"])
     if df is None or df.empty:
         return False
 
-    df = df.sort_values("date")
-    data_points = [
-        {"date": fmt_date(row["date"]), "value": float(row["value"])}
-        for _, row in df.iterrows()
-        if not pd.isna(row["value"])
-    ]
+    df = ensure_sorted(df)
+    data_points = build_data_points(df)
 
     payload = {
         "id": series_id,
@@ -240,12 +322,8 @@ def export_single_index(
     if df is None or df.empty:
         return False
 
-    df = df.sort_values("date")
-    data_points = [
-        {"date": fmt_date(row["date"]), "value": float(row["value"])}
-        for _, row in df.iterrows()
-        if not pd.isna(row["value"])
-    ]
+    df = ensure_sorted(df)
+    data_points = build_data_points(df)
     config = get_index_config(index_id)
     payload = {
         "id": index_id,
@@ -257,8 +335,22 @@ def export_single_index(
     return True
 
 
-def export_glci(storage: DataStorage, output_dir: Path) -> bool:
-    glci_df = storage.load_curated("indices", "glci")
+@lru_cache(maxsize=4)
+def _load_weights(path: str, mtime_ns: int) -> dict:
+    """Parse the GLCI weights file; keyed on mtime so a rewrite is re-read.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    return json.loads(Path(path).read_bytes())
+
+
+def export_glci(
+    storage: DataStorage,
+    output_dir: Path,
+    glci_df: pd.DataFrame | None = None,
+) -> bool:
+    if glci_df is None:
+        glci_df = storage.load_curated("indices", "glci")
     pillars_df = storage.load_curated("indices", "glci_pillars")
     weights_path = CURATED_DATA_PATH / "indices" / "glci_weights.json"
 
@@ -267,46 +359,55 @@ def export_glci(storage: DataStorage, output_dir: Path) -> bool:
     if not weights_path.exists():
         return False
 
-    with open(weights_path, "r") as f:
-        weights = json.load(f)
+    weights = _load_weights(str(weights_path), weights_path.stat().st_mtime_ns)
     pillar_weights = weights.get("pillar_weights", {})
 
-    glci_df = glci_df.sort_values("date")
-    pillars_df = pillars_df.sort_values("date")
+    glci_df = ensure_sorted(glci_df)
+    pillars_df = ensure_sorted(pillars_df)
 
     latest = glci_df.iloc[-1]
     regime_code = int(latest.get("regime", 0))
     regime_label = REGIME_LABELS.get(regime_code, "unknown")
 
-    # Build pillar list for latest
-    latest_pillars = pillars_df.iloc[-1]
-    pillar_list = []
-    for name, weight in pillar_weights.items():
-        if name in latest_pillars:
-            value = float(latest_pillars[name]) if not pd.isna(latest_pillars[name]) else 0
-            pillar_list.append(
-                {
-                    "name": name,
-                    "value": value,
-                    "weight": weight,
-                    "contribution": value * weight,
-                }
-            )
+    # Pull every weighted pillar out of the frame in one extraction; the
+    # latest values and the histories are both read from this matrix. A
+    # missing latest pillar reads as 0.
+    pillar_names = [name for name in pillar_weights if name in pillars_df.columns]
+    pillar_matrix = pillars_df[pillar_names].to_numpy(dtype=float, na_value=np.nan)
+    pillar_present = ~np.isnan(pillar_matrix)
+    pillar_observed = pillar_present[-1].tolist()
+    pillar_values = [
+        value if observed else 0
+        for value, observed in zip(pillar_matrix[-1].tolist(), pillar_observed)
+    ]
+    pillar_list = [
+        {
+            "name": name,
+            "value": value,
+            "weight": pillar_weights[name],
+            "contribution": value * pillar_weights[name],
+        }
+        for name, value in zip(pillar_names, pillar_values)
+    ]
 
+    # Format the GLCI dates once; the data series and the regime history
+    # both read from this array rather than rescanning the frame.
+    glci_dates = np.asarray(fmt_dates(glci_df["date"]), dtype=object)
+    glci_values = glci_df["value"].to_numpy(dtype=float, na_value=np.nan)
+    valued = ~np.isnan(glci_values)
     data_series = [
-        {"date": fmt_date(row["date"]), "value": float(row["value"])}
-        for _, row in glci_df.iterrows()
-        if not pd.isna(row["value"])
+        {"date": d, "value": v}
+        for d, v in zip(glci_dates[valued], glci_values[valued].tolist())
     ]
 
+    pillar_dates = np.asarray(fmt_dates(pillars_df["date"]), dtype=object)
     pillar_data: Dict[str, List[Dict[str, float]]] = {}
-    for name in pillar_weights.keys():
-        if name in pillars_df.columns:
-            pillar_data[name] = [
-                {"date": fmt_date(row["date"]), "value": float(row[name])}
-                for _, row in pillars_df.iterrows()
-                if not pd.isna(row[name])
-            ]
+    for j, name in enumerate(pillar_names):
+        observed = pillar_present[:, j]
+        pillar_data[name] = [
+            {"date": d, "value": v}
+            for d, v in zip(pillar_dates[observed], pillar_matrix[observed, j].tolist())
+        ]
 
     payload = {
         "value": float(latest["value"]),
@@ -338,62 +439,48 @@ def export_glci(storage: DataStorage, output_dir: Path) -> bool:
     write_json(
         output_dir / "api" / "glci" / "pillars" / "index.json",
         {
-            "date": fmt_date(latest_pillars["date"]),
+            "date": fmt_date(pillars_df["date"].iloc[-1]),
             "pillars": {
-                name: {
-                    "value": float(latest_pillars[name])
-                    if not pd.isna(latest_pillars[name])
-                    else 0,
-                    "weight": pillar_weights.get(name, 0),
-                    "contribution": (
-                        float(latest_pillars[name]) * pillar_weights.get(name, 0)
-                        if not pd.isna(latest_pillars[name])
-                        else 0
-                    ),
+                pillar["name"]: {
+                    "value": pillar["value"],
+                    "weight": pillar["weight"],
+                    "contribution": pillar["contribution"] if observed else 0,
                 }
-                for name in pillar_weights.keys()
-                if name in latest_pillars
+                for pillar, observed in zip(pillar_list, pillar_observed)
             },
         },
     )
 
     # Regime history
-    all_regimes = glci_df[["date", "regime"]].copy()
+    regimes = glci_df["regime"].to_numpy(dtype=float, na_value=np.nan)
     latest_history_regime = None
-    if pd.notna(all_regimes["regime"].iloc[-1]):
-        latest_history_regime = REGIME_LABELS.get(
-            int(all_regimes["regime"].iloc[-1])
-        )
-    regimes_df = all_regimes
-    regimes_df = regimes_df.dropna(subset=["regime"]).reset_index(drop=True)
-    regimes_df["regime_label"] = regimes_df["regime"].map(REGIME_LABELS)
+    if not np.isnan(regimes[-1]):
+        latest_history_regime = REGIME_LABELS.get(int(regimes[-1]))
+    classified = ~np.isnan(regimes)
+    # Regime codes -1/0/1 index straight into the label categories, so the
+    # labels never exist as per-row strings; unknown codes become missing.
+    codes = regimes[classified] + 1
+    codes = np.where(np.isin(codes, [0, 1, 2]), codes, -1).astype(np.int8)
+    regime_labels = pd.Categorical.from_codes(
+        codes, categories=[REGIME_LABELS[r] for r in (-1, 0, 1)]
+    )
 
-    periods = []
-    current_regime = None
-    period_start = None
-    for _, row in regimes_df.iterrows():
-        regime = row["regime_label"]
-        date = row["date"]
-        if regime != current_regime:
-            if current_regime is not None:
-                periods.append(
-                    {
-                        "regime": current_regime,
-                        "start": fmt_date(period_start),
-                        "end": fmt_date(date),
-                    }
-                )
-            current_regime = regime
-            period_start = date
-    if current_regime is not None:
-        periods.append(
-            {
-                "regime": current_regime,
-                "start": fmt_date(period_start),
-                "end": fmt_date(regimes_df["date"].iloc[-1]),
-            }
-        )
-    regime_counts = regimes_df["regime_label"].value_counts().to_dict()
+    # Run-length encode the labels: a period ends on the date the next one
+    # starts, and the final period ends on the last classified date.
+    labels = np.asarray(regime_labels)
+    period_dates = glci_dates[classified]
+    run_starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else []
+    run_ends = list(run_starts[1:]) + [len(labels) - 1]
+    periods = [
+        {
+            "regime": labels[start],
+            "start": period_dates[start],
+            "end": period_dates[end],
+        }
+        for start, end in zip(run_starts, run_ends)
+    ]
+    regime_counts = pd.Series(regime_labels).value_counts()
+    regime_counts = regime_counts[regime_counts > 0].to_dict()
     write_json(
         output_dir / "api" / "glci" / "regime-history" / "index.json",
         {
@@ -410,36 +497,48 @@ def export_glci_freshness(
     storage: DataStorage, series_cfg: Dict[str, dict], output_dir: Path
 ) -> None:
     index_cfg = get_index_config("global_liquidity_credit_index") or {}
+    components = [
+        (pillar_name, comp["series"])
+        for pillar_name, pillar_cfg in index_cfg.get("pillars", {}).items()
+        for comp in pillar_cfg.get("components", [])
+    ]
+
+    # Each latest date is a parquet read; overlap them instead of reading
+    # one series at a time.
+    def latest_date(sid: str) -> pd.Timestamp | None:
+        return storage.get_latest_date(
+            series_cfg.get(sid, {}).get("source", "unknown"), sid
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        last_dates = list(pool.map(latest_date, [sid for _, sid in components]))
+
+    # One reference time so every component is aged against the same clock
+    now = pd.Timestamp.now(tz="UTC")
     freshness = []
-    for pillar_name, pillar_cfg in index_cfg.get("pillars", {}).items():
-        for comp in pillar_cfg.get("components", []):
-            sid = comp["series"]
-            src = series_cfg.get(sid, {}).get("source", "unknown")
-            last_date = storage.get_latest_date(src, sid)
-            if last_date is not None:
-                frequency = str(
-                    series_cfg.get(sid, {}).get("frequency", "")
-                ).lower()
-                days_old, is_stale = freshness_state(last_date, frequency)
-                freshness.append(
-                    {
-                        "series_id": sid,
-                        "pillar": pillar_name,
-                        "last_date": fmt_date(last_date),
-                        "days_old": int(days_old),
-                        "is_stale": is_stale,
-                    }
-                )
-            else:
-                freshness.append(
-                    {
-                        "series_id": sid,
-                        "pillar": pillar_name,
-                        "last_date": "unknown",
-                        "days_old": -1,
-                        "is_stale": True,
-                    }
-                )
+    for (pillar_name, sid), last_date in zip(components, last_dates):
+        if last_date is not None:
+            frequency = str(series_cfg.get(sid, {}).get("frequency", "")).lower()
+            days_old, is_stale = freshness_state(last_date, frequency, now=now)
+            freshness.append(
+                {
+                    "series_id": sid,
+                    "pillar": pillar_name,
+                    "last_date": fmt_date(last_date),
+                    "days_old": int(days_old),
+                    "is_stale": is_stale,
+                }
+            )
+        else:
+            freshness.append(
+                {
+                    "series_id": sid,
+                    "pillar": pillar_name,
+                    "last_date": "unknown",
+                    "days_old": -1,
+                    "is_stale": True,
+                }
+            )
     write_json(output_dir / "api" / "glci" / "freshness" / "index.json", freshness)
 
 
@@ -453,9 +552,16 @@ def export_glci_trust(
     )
 
 
-def export_risk_metrics(storage: DataStorage, output_dir: Path) -> bool:
+def export_risk_metrics(
+    storage: DataStorage,
+    output_dir: Path,
+    glci_df: pd.DataFrame | None = None,
+) -> bool:
     """Export risk metrics to JSON for Risk by Regime dashboard.
 
+    ``glci_df`` may be passed when the caller already loaded the curated
+    GLCI frame; it is only read, never modified.
+
     Outputs:
       <base>/api/risk/index.json - Full dashboard payload
       <base>/api/risk/{asset_id}/index.json - Per-asset details
@@ -465,10 +571,11 @@ def export_risk_metrics(storage: DataStorage, output_dir: Path) -> bool:
         return False
 
     # Get current regime from GLCI
-    glci_df = storage.load_curated("indices", "glci")
+    if glci_df is None:
+        glci_df = storage.load_curated("indices", "glci")
     current_regime = None
     if glci_df is not None and not glci_df.empty:
-        glci_df = glci_df.sort_values("date")
+        glci_df = ensure_sorted(glci_df)
         regimes = pd.to_numeric(
             glci_df.get("regime", pd.Series(dtype=float)),
             errors="coerce",
@@ -476,38 +583,71 @@ def export_risk_metrics(storage: DataStorage, output_dir: Path) -> bool:
         if not regimes.empty and pd.notna(regimes.iloc[-1]):
             current_regime = REGIME_LABELS.get(int(regimes.iloc[-1]))
 
+    # Convert whole columns once instead of per row; missing headline
+    # metrics read as 0 and missing regime breakdowns as None.
+    def rounded(column: str, decimals: int, missing: Any) -> List[Any]:
+        if column not in risk_df.columns:
+            return [missing] * len(risk_df)
+        return round_column(risk_df[column], decimals, missing)
+
+    regime_names = ["tight", "neutral", "loose"]
+    categories = (
+        risk_df["category"].tolist()
+        if "category" in risk_df.columns
+        else ["Other"] * len(risk_df)
+    )
+    metrics = {
+        column: rounded(column, 2, 0)
+        for column in (
+            "current_sharpe",
+            "annualized_return",
+            "annualized_volatility",
+            "max_drawdown",
+        )
+    }
+    sharpe_by_regime = [rounded(f"sharpe_{r}", 2, None) for r in regime_names]
+    return_by_regime = [rounded(f"return_{r}", 2, None) for r in regime_names]
+    correlations = rounded("correlation_with_glci", 3, None)
+
+    # Rolling Sharpe histories are one parquet file per asset; read them
+    # concurrently rather than one after another inside the loop.
+    asset_ids = risk_df["asset_id"].tolist()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        rolling_frames = list(
+            pool.map(
+                lambda a: storage.load_curated("risk", f"rolling_sharpe_{a}"),
+                asset_ids,
+            )
+        )
+
     # Build assets list
     assets = []
-    for _, row in risk_df.iterrows():
+    for i, (asset_id, name) in enumerate(zip(asset_ids, risk_df["name"].tolist())):
         asset = {
-            "id": row["asset_id"],
-            "name": row["name"],
-            "category": row.get("category", "Other"),
-            "current_sharpe": round(float(row["current_sharpe"]), 2) if pd.notna(row["current_sharpe"]) else 0,
-            "annualized_return": round(float(row["annualized_return"]), 2) if pd.notna(row["annualized_return"]) else 0,
-            "annualized_volatility": round(float(row["annualized_volatility"]), 2) if pd.notna(row["annualized_volatility"]) else 0,
-            "max_drawdown": round(float(row["max_drawdown"]), 2) if pd.notna(row["max_drawdown"]) else 0,
+            "id": asset_id,
+            "name": name,
+            "category": categories[i],
+            **{column: values[i] for column, values in metrics.items()},
             "sharpe_by_regime": {
-                "tight": round(float(row["sharpe_tight"]), 2) if pd.notna(row.get("sharpe_tight")) else None,
-                "neutral": round(float(row["sharpe_neutral"]), 2) if pd.notna(row.get("sharpe_neutral")) else None,
-                "loose": round(float(row["sharpe_loose"]), 2) if pd.notna(row.get("sharpe_loose")) else None,
+                r: values[i] for r, values in zip(regime_names, sharpe_by_regime)
             },
             "return_by_regime": {
-                "tight": round(float(row["return_tight"]), 2) if pd.notna(row.get("return_tight")) else None,
-                "neutral": round(float(row["return_neutral"]), 2) if pd.notna(row.get("return_neutral")) else None,
-                "loose": round(float(row["return_loose"]), 2) if pd.notna(row.get("return_loose")) else None,
+                r: values[i] for r, values in zip(regime_names, return_by_regime)
             },
-            "correlation_with_glci": round(float(row["correlation_with_glci"]), 3) if pd.notna(row.get("correlation_with_glci")) else None,
+            "correlation_with_glci": correlations[i],
         }
 
         # Try to load rolling sharpe data
-        rolling_df = storage.load_curated("risk", f"rolling_sharpe_{row['asset_id']}")
+        rolling_df = rolling_frames[i]
         if rolling_df is not None and not rolling_df.empty:
-            rolling_df = rolling_df.sort_values("date")
+            rolling_df = ensure_sorted(rolling_df)
+            rolling_observed = rolling_df["value"].notna().to_numpy()
             asset["rolling_sharpe"] = [
-                {"date": fmt_date(r["date"]), "value": round(float(r["value"]), 3)}
-                for _, r in rolling_df.iterrows()
-                if pd.notna(r["value"])
+                {"date": d, "value": v}
+                for d, v in zip(
+                    fmt_dates(rolling_df.loc[rolling_observed, "date"]),
+                    round_column(rolling_df.loc[rolling_observed, "value"], 3),
+                )
             ]
         else:
             asset["rolling_sharpe"] = []
@@ -725,10 +865,38 @@ def validate_required_exports(output_dir: Path) -> list[str]:
     return errors
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link a snapshot file, copying when linking is not possible.
+
+    Safe because every export starts by removing the output tree, so later
+    runs write new files rather than rewriting the linked ones.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _init_export_worker(json_indent: int | None, json_gzip: bool) -> None:
+    # Spawned workers re-import this module, so carry the output flags across
+    global JSON_INDENT, JSON_GZIP
+    JSON_INDENT = json_indent
+    JSON_GZIP = json_gzip
+
+
+def _export_series_job(job: tuple[DataStorage, str, dict, Path]) -> bool:
+    return export_single_series(*job)
+
+
+def _export_index_job(job: tuple[DataStorage, str, Path]) -> bool:
+    return export_single_index(*job)
+
+
 def export_all(
     output_dir: Path,
     add_snapshot: bool,
     require_production: bool = False,
+    max_workers: int | None = None,
 ) -> None:
     storage = DataStorage(raw_path=RAW_DATA_PATH, curated_path=CURATED_DATA_PATH)
     series_cfg = get_all_series()
@@ -739,10 +907,23 @@ def export_all(
 
     print(f"[export] Writing JSON to {output_dir}")
 
-    # Series
+    # Series and indices: each one reads its own parquet file and writes
+    # its own endpoints, so both are exported in the same worker pool.
+    series_jobs = [(storage, sid, cfg, output_dir) for sid, cfg in series_cfg.items()]
+    index_jobs = [(storage, idx, output_dir) for idx in index_cfg.keys()]
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_export_worker,
+        initargs=(JSON_INDENT, JSON_GZIP),
+    ) as pool:
+        # map() submits eagerly, so queue both batches before collecting
+        pending_series = pool.map(_export_series_job, series_jobs)
+        pending_indices = pool.map(_export_index_job, index_jobs)
+        series_results = list(pending_series)
+        index_results = list(pending_indices)
+
     exported_series_ids = set()
-    for sid, cfg in series_cfg.items():
-        ok = export_single_series(storage, sid, cfg, output_dir)
+    for (_, sid, _, _), ok in zip(series_jobs, series_results):
         if not ok:
             print(f"[export] Skipped series (no data): {sid}")
             continue
@@ -751,13 +932,13 @@ def export_all(
 
     # Indices
     export_indices_list(index_cfg, output_dir)
-    for idx in index_cfg.keys():
-        ok = export_single_index(storage, idx, output_dir)
+    for (_, idx, _), ok in zip(index_jobs, index_results):
         if not ok:
             print(f"[export] Skipped index (no data): {idx}")
 
-    # GLCI endpoints
-    glci_ok = export_glci(storage, output_dir)
+    # GLCI endpoints; the curated frame is loaded once and shared with risk
+    glci_df = storage.load_curated("indices", "glci")
+    glci_ok = export_glci(storage, output_dir, glci_df)
     if not glci_ok:
         print("[export] Skipped GLCI (missing curated data)")
     else:
@@ -765,7 +946,7 @@ def export_all(
         export_glci_trust(storage, series_cfg, output_dir)
 
     # Risk metrics endpoints
-    risk_ok = export_risk_metrics(storage, output_dir)
+    risk_ok = export_risk_metrics(storage, output_dir, glci_df)
     if not risk_ok:
         print("[export] Skipped risk metrics (no data - run risk computation first)")
     else:
@@ -799,7 +980,7 @@ def export_all(
         snap_dir = output_dir.parent / "snapshots" / date_stamp
         if snap_dir.exists():
             shutil.rmtree(snap_dir)
-        shutil.copytree(output_dir, snap_dir)
+        shutil.copytree(output_dir, snap_dir, copy_function=_link_or_copy)
         print(f"[export] Snapshot copied to {snap_dir}")
 
 
@@ -823,9 +1004,22 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Fail if required production static endpoints are missing or empty",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output for human reading (default: compact)",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Also write a gzip-compressed index.json.gz beside each index.json",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
+    if args.pretty:
+        JSON_INDENT = 2
+    JSON_GZIP = args.gzip
     export_all(args.output, args.snapshot, args.require_production)
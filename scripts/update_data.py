@@ -12,6 +12,7 @@ Example GitHub Actions workflow:
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -132,25 +133,6 @@ def main():
         "sp500_price",
     ]
     
-    results = fetcher.fetch_multiple(priority_series, start_date, end_date)
-    missing_required = [
-        series_id
-        for series_id in priority_series
-        if series_id not in results or results[series_id].empty
-    ]
-    if missing_required:
-        print("\nERROR: Required production series failed to fetch:")
-        for series_id in missing_required:
-            print(f"  - {series_id}")
-        print("Aborting before export so the existing published data stays intact.")
-        sys.exit(1)
-    
-    for series_id, df in results.items():
-        if not df.empty:
-            source = df["source"].iloc[0]
-            storage.append_raw(df, source, series_id)
-            print(f"  ✓ {series_id}: {len(df)} obs")
-
     # Asset prices for the Playbook and Flows pages. Best effort: a failed
     # fetch here (e.g. Yahoo throttling the runner) skips that asset but
     # never blocks the publish, so these are kept out of priority_series.
@@ -166,8 +148,44 @@ def main():
         "nasdaq100",
     ]
 
-    print("\n[1b/4] Fetching asset prices (best effort)...")
-    asset_results = fetcher.fetch_multiple(asset_series, start_date, end_date)
+    # Most asset prices come from Yahoo (bitcoin, ethereum and nasdaq100 are
+    # FRED series), so fetch them in the background while the priority
+    # series download rather than after. The two calls split
+    # fetch_multiple's default four workers, keeping the run inside the
+    # same FRED rate-limit budget as a single call.
+    with ThreadPoolExecutor(max_workers=1) as background:
+        asset_future = background.submit(
+            fetcher.fetch_multiple, asset_series, start_date, end_date,
+            max_workers=1,
+        )
+
+        results = fetcher.fetch_multiple(
+            priority_series, start_date, end_date, max_workers=3
+        )
+        missing_required = [
+            series_id
+            for series_id in priority_series
+            if series_id not in results or results[series_id].empty
+        ]
+        if missing_required:
+            # Leaving the block still waits for an asset fetch already in
+            # flight, so the worker is never orphaned past exit
+            asset_future.cancel()
+            print("\nERROR: Required production series failed to fetch:")
+            for series_id in missing_required:
+                print(f"  - {series_id}")
+            print("Aborting before export so the existing published data stays intact.")
+            sys.exit(1)
+
+        for series_id, df in results.items():
+            if not df.empty:
+                source = df["source"].iloc[0]
+                storage.append_raw(df, source, series_id)
+                print(f"  ✓ {series_id}: {len(df)} obs")
+
+        print("\n[1b/4] Fetching asset prices (best effort)...")
+        asset_results = asset_future.result()
+
     for series_id in asset_series:
         df = asset_results.get(series_id)
         if df is None or df.empty:
@@ -1,16 +1,25 @@
 """FastAPI server exposing liquidity data."""
 import json
 import os
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
 import warnings
 
+import numpy as np
 import pandas as pd
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from ..config import (
     CURATED_DATA_PATH,
+    config_generation,
     get_all_indices,
     get_all_series,
     get_index_config,
@@ -45,39 +54,83 @@ class GLCICache:
     """Cache GLCI computation results with TTL."""
     def __init__(self, ttl_seconds: int = 300) -> None:  # 5 minute default TTL
         self.ttl = ttl_seconds
-        self._cache: dict[str, GLCIResult] = {}
-        self._timestamps: dict[str, datetime] = {}
+        # key -> (monotonic time stored, result); one lookup per get
+        self._cache: dict[str, tuple[float, GLCIResult]] = {}
 
     def _make_key(self, start: str, end: str) -> str:
         return f"{start}:{end}"
 
     def get(self, start: str, end: str) -> GLCIResult | None:
         key = self._make_key(start, end)
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
 
         # Check TTL
-        cached_time = self._timestamps.get(key, datetime.min)
-        if datetime.now() - cached_time > timedelta(seconds=self.ttl):
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl:
             del self._cache[key]
-            del self._timestamps[key]
             return None
 
-        return self._cache[key]
+        return result
 
     def set(self, start: str, end: str, result: GLCIResult) -> None:
-        key = self._make_key(start, end)
-        self._cache[key] = result
-        self._timestamps[key] = datetime.now()
+        self._cache[self._make_key(start, end)] = (time.monotonic(), result)
 
     def clear(self) -> None:
         self._cache.clear()
-        self._timestamps.clear()
 
 
 glci_cache = GLCICache(ttl_seconds=300)  # Cache for 5 minutes
 
 
+class ResponseCache:
+    """Cache encoded endpoint responses with TTL.
+
+    Entries keep the status code and body bytes, so a hit skips the
+    upstream fetch, model building and JSON encoding. Not-found results are
+    kept briefly so a bad ID cannot hammer the data sources. The oldest
+    entry is evicted once ``max_entries`` is reached.
+    """
+    def __init__(self, ttl_seconds: int = 3600, not_found_ttl_seconds: int = 60,
+                 max_entries: int = 512) -> None:
+        self.ttl = ttl_seconds
+        self.not_found_ttl = not_found_ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[tuple, tuple[float, int, bytes]] = {}
+
+    def get(self, key: tuple) -> Response | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, status_code, body = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        return Response(content=body, status_code=status_code,
+                        media_type="application/json")
+
+    def set(self, key: tuple, response: Response) -> Response:
+        ttl = self.not_found_ttl if response.status_code == 404 else self.ttl
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (
+            time.monotonic() + ttl,
+            response.status_code,
+            bytes(response.body),
+        )
+        return response
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Series data only changes on the daily publish, so an hour is safe
+response_cache = ResponseCache(ttl_seconds=3600)
+
+
 app = FastAPI(
     title="Global Liquidity Tracker API",
     description="API for fetching global liquidity and credit metrics",
@@ -93,12 +146,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GLCI and series payloads are long, repetitive JSON; small bodies are left
+# uncompressed, and clients that do not send Accept-Encoding get plain JSON
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # Initialize services
 fetcher = DataFetcher()
 storage = DataStorage()
 aggregator = Aggregator(fetcher)
 glci_computer = GLCIComputer(fetcher, storage)
 
+# GLCIComputer keeps per-run state (the feature builder's quality reports),
+# so computes started from concurrent requests must not overlap
+_glci_compute_lock = threading.Lock()
+
+
+def _compute_glci(*args, **kwargs) -> GLCIResult:
+    """Run ``glci_computer.compute`` under the shared compute lock.
+
+    Meant for ``run_in_threadpool``: the wait happens on a worker thread,
+    so the event loop keeps serving other requests meanwhile.
+    """
+    with _glci_compute_lock:
+        return glci_computer.compute(*args, **kwargs)
+
 
 class SeriesInfo(BaseModel):
     id: str
@@ -172,6 +243,59 @@ class GLCIDetailedResponse(GLCIResponse):
     data_quality: dict[str, dict]  # Quality info per pillar
 
 
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a response model directly, bypassing FastAPI's re-validation.
+
+    Used for large DataPoint payloads built with ``model_construct`` from
+    already-typed frames; pydantic's serializer still writes NaN as null.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _data_points(df: pd.DataFrame, column: str = "value") -> list[DataPoint]:
+    """DataPoints for the rows of ``df`` with a value in ``column``.
+
+    Dates are formatted and values converted column-wise rather than via
+    ``iterrows``, which builds a Series per row and upcasts mixed
+    date/float rows.
+    """
+    observed = df[column].notna()
+    dates = df.loc[observed, "date"].dt.strftime("%Y-%m-%d").tolist()
+    values = df.loc[observed, column].astype(float).tolist()
+    return [DataPoint.model_construct(date=d, value=v) for d, v in zip(dates, values)]
+
+
+class DateRange(NamedTuple):
+    start: str
+    end: str
+
+
+def date_range(years: int):
+    """Dependency resolving the optional start/end query parameters.
+
+    Missing bounds default to the last ``years`` years ending today, both
+    taken from a single clock reading so they agree within a request. The
+    resolver is async only so FastAPI calls it inline, not in a thread.
+    """
+    async def resolve(
+        start: str | None = Query(None, description="Start date (YYYY-MM-DD)"),
+        end: str | None = Query(None, description="End date (YYYY-MM-DD)"),
+    ) -> DateRange:
+        if start and end:
+            return DateRange(start, end)
+        now = datetime.now()
+        return DateRange(
+            start or (now - timedelta(days=365 * years)).strftime("%Y-%m-%d"),
+            end or now.strftime("%Y-%m-%d"),
+        )
+    return resolve
+
+
+def _not_found(detail: str) -> JSONResponse:
+    """A 404 with the same body FastAPI renders for HTTPException."""
+    return JSONResponse({"detail": detail}, status_code=404)
+
+
 # Category mapping for frontend
 CATEGORY_MAP = {
     "fed_total_assets": "Central Banks",
@@ -237,60 +361,64 @@ async def get_flows():
         raise HTTPException(status_code=500, detail="Saved flows data is invalid") from exc
 
 
-@app.get("/api/series", response_model=list[SeriesInfo])
-async def list_series():
-    """List all available series."""
-    all_series = get_all_series()
-    result = []
-    
-    for series_id, config in all_series.items():
-        result.append(SeriesInfo(
+@lru_cache(maxsize=1)
+def _series_list_body(generation: int) -> bytes:
+    """Serialized /api/series body; rebuilt when the config generation changes."""
+    items = [
+        SeriesInfo(
             id=series_id,
             name=config.get("description", series_id),
             source=config.get("source", "unknown").upper(),
             category=CATEGORY_MAP.get(series_id, "Other"),
             frequency=config.get("frequency", "unknown"),
             unit=config.get("unit", ""),
-        ))
-    
-    return result
+        ).model_dump()
+        for series_id, config in get_all_series().items()
+    ]
+    return json.dumps(items).encode()
+
+
+@app.get("/api/series", response_model=list[SeriesInfo])
+async def list_series():
+    """List all available series."""
+    # Built once: skips model validation and encoding on every request
+    return Response(content=_series_list_body(config_generation()), media_type="application/json")
 
 
 @app.get("/api/series/{series_id}", response_model=SeriesResponse)
 async def get_series(
     series_id: str,
-    start: str | None = Query(None, description="Start date (YYYY-MM-DD)"),
-    end: str | None = Query(None, description="End date (YYYY-MM-DD)"),
+    dates: DateRange = Depends(date_range(years=3)),
 ):
     """Fetch data for a specific series."""
     config = get_series_config(series_id)
     if not config:
         raise HTTPException(status_code=404, detail=f"Series '{series_id}' not found")
     
-    # Default date range: 3 years
-    if not start:
-        start = (datetime.now() - timedelta(days=365 * 3)).strftime("%Y-%m-%d")
-    if not end:
-        end = datetime.now().strftime("%Y-%m-%d")
+    start, end = dates
     
+    cache_key = ("series", series_id, start, end)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        df = fetcher.fetch_series(series_id, start, end)
+        df = await run_in_threadpool(fetcher.fetch_series, series_id, start, end)
         
         if df.empty:
-            raise HTTPException(status_code=404, detail=f"No data found for '{series_id}'")
+            return response_cache.set(
+                cache_key, _not_found(f"No data found for '{series_id}'")
+            )
         
-        data = [
-            DataPoint(date=row["date"].strftime("%Y-%m-%d"), value=float(row["value"]))
-            for _, row in df.iterrows()
-        ]
+        data = _data_points(df)
         
-        return SeriesResponse(
+        return response_cache.set(cache_key, _model_response(SeriesResponse.model_construct(
             id=series_id,
             name=config.get("description", series_id),
             source=config.get("source", "unknown").upper(),
             unit=config.get("unit", ""),
             data=data,
-        )
+        )))
     except HTTPException:
         raise
     except Exception as e:
@@ -305,86 +433,100 @@ async def get_series_latest(series_id: str):
         raise HTTPException(status_code=404, detail=f"Series '{series_id}' not found")
     
     try:
-        start = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-        end = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        start = (now - timedelta(days=30)).strftime("%Y-%m-%d")
+        end = now.strftime("%Y-%m-%d")
+
+        cache_key = ("series_latest", series_id, start, end)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        df = fetcher.fetch_series(series_id, start, end)
+        df = await run_in_threadpool(fetcher.fetch_series, series_id, start, end)
         
         if df.empty:
-            raise HTTPException(status_code=404, detail=f"No data found for '{series_id}'")
+            return response_cache.set(
+                cache_key, _not_found(f"No data found for '{series_id}'")
+            )
         
-        latest = df.iloc[-1]
+        # Index the columns directly; iloc would build a Series per row
+        values = df["value"].to_numpy(dtype=float)
+        latest_value = float(values[-1])
         
         # Calculate change from 7 days ago if available
         change = 0.0
-        if len(df) > 7:
-            prev = df.iloc[-8]["value"]
-            change = ((latest["value"] - prev) / prev) * 100 if prev != 0 else 0
+        if len(values) > 7:
+            prev = float(values[-8])
+            change = ((latest_value - prev) / prev) * 100 if prev != 0 else 0
         
-        return {
+        return response_cache.set(cache_key, JSONResponse({
             "id": series_id,
-            "date": latest["date"].strftime("%Y-%m-%d"),
-            "value": float(latest["value"]),
+            "date": pd.Timestamp(df["date"].to_numpy()[-1]).strftime("%Y-%m-%d"),
+            "value": latest_value,
             "change": round(change, 2),
             "unit": config.get("unit", ""),
-        }
+        }))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/indices", response_model=list[dict])
-async def list_indices():
-    """List all available composite indices."""
-    all_indices = get_all_indices()
-    result = []
-    
-    for index_id, config in all_indices.items():
-        result.append({
+@lru_cache(maxsize=1)
+def _indices_list_body(generation: int) -> bytes:
+    """Serialized /api/indices body; rebuilt when the config generation changes."""
+    items = [
+        {
             "id": index_id,
             "name": config.get("name", index_id.replace("_", " ").title()),
             "description": config.get("description", ""),
             "frequency": config.get("frequency", ""),
             "components": len(config.get("components", config.get("pillars", {}))),
-        })
-    
-    return result
+        }
+        for index_id, config in get_all_indices().items()
+    ]
+    return json.dumps(items).encode()
+
+
+@app.get("/api/indices", response_model=list[dict])
+async def list_indices():
+    """List all available composite indices."""
+    return Response(content=_indices_list_body(config_generation()), media_type="application/json")
 
 
 @app.get("/api/indices/{index_id}", response_model=IndexResponse)
 async def get_index(
     index_id: str,
-    start: str | None = Query(None, description="Start date (YYYY-MM-DD)"),
-    end: str | None = Query(None, description="End date (YYYY-MM-DD)"),
+    dates: DateRange = Depends(date_range(years=3)),
 ):
     """Compute and return a composite index."""
     config = get_index_config(index_id)
     if not config:
         raise HTTPException(status_code=404, detail=f"Index '{index_id}' not found")
     
-    if not start:
-        start = (datetime.now() - timedelta(days=365 * 3)).strftime("%Y-%m-%d")
-    if not end:
-        end = datetime.now().strftime("%Y-%m-%d")
+    start, end = dates
     
+    cache_key = ("index", index_id, start, end)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        df = aggregator.compute_index(index_id, start, end)
+        df = await run_in_threadpool(aggregator.compute_index, index_id, start, end)
         
         if df.empty:
-            raise HTTPException(status_code=404, detail=f"No data computed for '{index_id}'")
+            return response_cache.set(
+                cache_key, _not_found(f"No data computed for '{index_id}'")
+            )
         
-        data = [
-            DataPoint(date=row["date"].strftime("%Y-%m-%d"), value=float(row["value"]))
-            for _, row in df.iterrows()
-        ]
+        data = _data_points(df)
         
-        return IndexResponse(
+        return response_cache.set(cache_key, _model_response(IndexResponse.model_construct(
             id=index_id,
             name=config.get("name", index_id.replace("_", " ").title()),
             description=config.get("description", ""),
             data=data,
-        )
+        )))
     except HTTPException:
         raise
     except Exception as e:
@@ -393,20 +535,18 @@ async def get_index(
 
 @app.get("/api/glci", response_model=GLCIResponse)
 async def get_glci(
-    start: str | None = Query(None, description="Start date (YYYY-MM-DD)"),
-    end: str | None = Query(None, description="End date (YYYY-MM-DD)"),
+    dates: DateRange = Depends(date_range(years=5)),
 ):
     """Get the Global Liquidity & Credit Index with pillar breakdown."""
-    if not start:
-        start = (datetime.now() - timedelta(days=365 * 5)).strftime("%Y-%m-%d")
-    if not end:
-        end = datetime.now().strftime("%Y-%m-%d")
+    start, end = dates
     
     try:
         # Check cache first
         result = glci_cache.get(start, end)
         if result is None:
-            result = glci_computer.compute(start, end, save_output=False, verbose=False)
+            result = await run_in_threadpool(
+                _compute_glci, start, end, save_output=False, verbose=False
+            )
             glci_cache.set(start, end, result)
         
         glci_df = result.glci
@@ -434,20 +574,14 @@ async def get_glci(
                 ))
         
         # Build time series data
-        data = [
-            DataPoint(date=row["date"].strftime("%Y-%m-%d"), value=float(row["value"]))
-            for _, row in glci_df.iterrows()
-        ]
+        data = _data_points(glci_df)
         
-        # Build pillar time series
-        pillar_data = {}
-        for pillar_name in ["liquidity", "credit", "stress"]:
-            if pillar_name in pillars_df.columns:
-                pillar_data[pillar_name] = [
-                    DataPoint(date=row["date"].strftime("%Y-%m-%d"), value=float(row[pillar_name]))
-                    for _, row in pillars_df.iterrows()
-                    if not (row[pillar_name] != row[pillar_name])  # Skip NaN
-                ]
+        # Build pillar time series (NaN observations are skipped)
+        pillar_data = {
+            pillar_name: _data_points(pillars_df, pillar_name)
+            for pillar_name in ["liquidity", "credit", "stress"]
+            if pillar_name in pillars_df.columns
+        }
         
         # Map regime
         regime_map = {-1: "tight", 0: "neutral", 1: "loose"}
@@ -484,22 +618,28 @@ async def get_glci_latest():
         
         # Otherwise compute fresh
         start = (datetime.now() - timedelta(days=365 * 3)).strftime("%Y-%m-%d")
-        result = glci_computer.compute(start, save_output=False, verbose=False)
+        result = await run_in_threadpool(
+            _compute_glci, start, save_output=False, verbose=False
+        )
         
         glci_df = result.glci
         if glci_df.empty:
             raise HTTPException(status_code=404, detail="No GLCI data")
         
-        latest_row = glci_df.iloc[-1]
         regime_map = {-1: "tight", 0: "neutral", 1: "loose"}
+        regime = int(glci_df["regime"].to_numpy()[-1])
+        momentum = (
+            float(glci_df["momentum"].to_numpy()[-1])
+            if "momentum" in glci_df.columns else 0.0
+        )
         
         return {
-            "date": latest_row["date"].strftime("%Y-%m-%d"),
-            "value": float(latest_row["value"]),
-            "zscore": float(latest_row["zscore"]),
-            "regime": int(latest_row["regime"]),
-            "regime_label": regime_map.get(int(latest_row["regime"]), "unknown"),
-            "momentum": float(latest_row.get("momentum", 0)) if latest_row.get("momentum") == latest_row.get("momentum") else 0
+            "date": pd.Timestamp(glci_df["date"].to_numpy()[-1]).strftime("%Y-%m-%d"),
+            "value": float(glci_df["value"].to_numpy()[-1]),
+            "zscore": float(glci_df["zscore"].to_numpy()[-1]),
+            "regime": regime,
+            "regime_label": regime_map.get(regime, "unknown"),
+            "momentum": momentum if momentum == momentum else 0
         }
     except HTTPException:
         raise
@@ -517,7 +657,9 @@ async def get_glci_pillars():
         
         # Compute fresh if not cached
         start = (datetime.now() - timedelta(days=365 * 3)).strftime("%Y-%m-%d")
-        result = glci_computer.compute(start, save_output=False, verbose=False)
+        result = await run_in_threadpool(
+            _compute_glci, start, save_output=False, verbose=False
+        )
         
         if result.pillars.empty:
             raise HTTPException(status_code=404, detail="No pillar data")
@@ -573,20 +715,18 @@ async def get_glci_trust():
 
 @app.get("/api/glci/regime-history")
 async def get_regime_history(
-    start: str | None = Query(None, description="Start date (YYYY-MM-DD)"),
-    end: str | None = Query(None, description="End date (YYYY-MM-DD)"),
+    dates: DateRange = Depends(date_range(years=10)),
 ):
     """Get historical regime data for timeline visualization."""
-    if not start:
-        start = (datetime.now() - timedelta(days=365 * 10)).strftime("%Y-%m-%d")
-    if not end:
-        end = datetime.now().strftime("%Y-%m-%d")
+    start, end = dates
     
     try:
         # Check cache first
         result = glci_cache.get(start, end)
         if result is None:
-            result = glci_computer.compute(start, end, save_output=False, verbose=False)
+            result = await run_in_threadpool(
+                _compute_glci, start, end, save_output=False, verbose=False
+            )
             glci_cache.set(start, end, result)
         
         latest_regime = None
@@ -594,32 +734,16 @@ async def get_regime_history(
             latest_regime = result.regimes["regime_label"].iloc[-1]
         regimes_df = result.regimes.dropna(subset=["regime"]).reset_index(drop=True)
         
-        # Build regime periods
-        periods = []
-        current_regime = None
-        period_start = None
-        
-        for _, row in regimes_df.iterrows():
-            regime = row["regime_label"]
-            date = row["date"]
-            
-            if regime != current_regime:
-                if current_regime is not None:
-                    periods.append({
-                        "regime": current_regime,
-                        "start": str(period_start)[:10],
-                        "end": str(date)[:10]
-                    })
-                current_regime = regime
-                period_start = date
-        
-        # Add final period
-        if current_regime is not None:
-            periods.append({
-                "regime": current_regime,
-                "start": str(period_start)[:10],
-                "end": str(regimes_df["date"].iloc[-1])[:10]
-            })
+        # Run-length encode the labels: a period ends on the date the next
+        # one starts, and the final period ends on the last classified date.
+        labels = regimes_df["regime_label"].to_numpy()
+        date_strs = regimes_df["date"].dt.strftime("%Y-%m-%d").tolist()
+        run_starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]]) if len(labels) else []
+        run_ends = list(run_starts[1:]) + [len(labels) - 1]
+        periods = [
+            {"regime": labels[run_start], "start": date_strs[run_start], "end": date_strs[run_end]}
+            for run_start, run_end in zip(run_starts, run_ends)
+        ]
         
         # Calculate stats
         regime_counts = regimes_df["regime_label"].value_counts().to_dict()
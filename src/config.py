@@ -1,5 +1,6 @@
 """Configuration loader for series and indices."""
 import os
+from functools import lru_cache
 from pathlib import Path
 import yaml
 from dotenv import load_dotenv
@@ -17,38 +18,84 @@ FRED_API_KEY = os.getenv("FRED_API_KEY", "")
 # Ensure data directories exist
 RAW_DATA_PATH = DATA_PATH / "raw"
 CURATED_DATA_PATH = DATA_PATH / "curated"
+# Fetch cache is opt-in (see DataFetcher), so it is created on first use
+CACHE_DATA_PATH = DATA_PATH / "cache"
 RAW_DATA_PATH.mkdir(parents=True, exist_ok=True)
 CURATED_DATA_PATH.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load the series configuration from YAML."""
+    """Load the series configuration from YAML.
+
+    Parsed once per process; the returned dict is shared, so callers must
+    not mutate it. Use :func:`reload_config` after editing the YAML.
+    """
     with open(CONFIG_PATH, "r") as f:
         return yaml.safe_load(f)
 
 
+_config_generation = 0
+
+
+def config_generation() -> int:
+    """Counter bumped by :func:`reload_config`.
+
+    Caches derived from the config outside this module key on it, so a
+    reload invalidates them without this module knowing about them.
+    """
+    return _config_generation
+
+
+def reload_config() -> None:
+    """Drop every cached view of the YAML so the next call re-reads it."""
+    global _config_generation
+    _config_generation += 1
+    load_config.cache_clear()
+    get_all_series.cache_clear()
+    get_all_indices.cache_clear()
+
+
 def get_series_config(series_id: str) -> dict:
-    """Get configuration for a specific series."""
-    config = load_config()
-    return config.get("series", {}).get(series_id, {})
+    """Get configuration for a specific series.
+
+    Served from the cached :func:`get_all_series` map, so lookups inside
+    fetch and export loops do not re-read the YAML.
+    """
+    return get_all_series().get(series_id, {})
 
 
 def get_index_config(index_id: str) -> dict:
-    """Get configuration for a specific composite index."""
-    config = load_config()
-    return config.get("indices", {}).get(index_id, {})
+    """Get configuration for a specific composite index.
+
+    Served from the cached :func:`get_all_indices` map.
+    """
+    return get_all_indices().get(index_id, {})
 
 
+@lru_cache(maxsize=1)
 def get_all_series() -> dict:
-    """Get all series configurations."""
+    """Get all series configurations.
+
+    Parsed once per process; the returned dict is shared, so callers must
+    not mutate it. Call :func:`reload_config` after editing the YAML at
+    runtime.
+    """
     return load_config().get("series", {})
 
 
+@lru_cache(maxsize=1)
 def get_all_indices() -> dict:
-    """Get all index configurations."""
+    """Get all index configurations.
+
+    Cached like :func:`get_all_series`; do not mutate the returned dict.
+    """
     return load_config().get("indices", {})
 
 
 def get_country_weights() -> dict:
-    """Get country GDP weights for weighted indices."""
+    """Get country GDP weights for weighted indices.
+
+    Read from the cached :func:`load_config`; do not mutate the result.
+    """
     return load_config().get("country_weights", {})
@@ -3,6 +3,7 @@ import pandas as pd
 import requests
 from pathlib import Path
 from .base import BaseClient
+from .http import retrying_session
 
 
 class BISClient(BaseClient):
@@ -26,7 +27,9 @@ class BISClient(BaseClient):
     
     def __init__(self, cache_path: Path | None = None) -> None:
         super().__init__(cache_path)
-        self.session = requests.Session()
+        # Pooled keep-alive connections with bounded retries on transient
+        # 429/5xx responses; the fetcher keeps one client per source
+        self.session = retrying_session()
         self.session.headers.update({
             "Accept": "application/vnd.sdmx.data+json;version=1.0.0"
         })
@@ -99,39 +102,69 @@ class BISClient(BaseClient):
             if not time_dim:
                 return pd.DataFrame(columns=["date", "value"])
             
-            # Extract observations
-            records = []
+            # Collect raw periods and values; dates and floats are converted
+            # column-wise afterwards rather than once per observation
+            periods = []
+            values_list = []
             for series_key, series_data in observations.items():
                 obs = series_data.get("observations", {})
                 for time_idx, values in obs.items():
                     time_idx = int(time_idx)
                     if time_idx < len(time_dim):
-                        period = time_dim[time_idx].get("id", "")
                         value = values[0] if values else None
                         if value is not None:
-                            records.append({
-                                "date": self._parse_period(period),
-                                "value": float(value)
-                            })
-            
-            return pd.DataFrame(records)
+                            periods.append(time_dim[time_idx].get("id", ""))
+                            values_list.append(value)
+
+            return pd.DataFrame({
+                "date": self._parse_periods(pd.Series(periods, dtype=object)),
+                "value": pd.Series(values_list, dtype=object).astype(float),
+            })
             
         except (KeyError, IndexError, TypeError) as e:
             raise RuntimeError(f"Failed to parse BIS SDMX response: {e}")
     
+    @staticmethod
+    def _parse_periods(periods: pd.Series) -> pd.Series:
+        """Convert a column of BIS period strings to timestamps.
+
+        Quarters ('2023-Q1') are dated at period end, months ('2023-01') and
+        years ('2023') at their first day. Each format is parsed in one call
+        for all matching rows; anything else falls back to ``pd.to_datetime``
+        on each value.
+        """
+        dates = pd.Series(pd.NaT, index=periods.index, dtype="datetime64[ns]")
+        if periods.empty:
+            return dates
+        periods = periods.astype(str)
+        lengths = periods.str.len()
+
+        quarterly = periods.str.contains("-Q", regex=False)
+        monthly = ~quarterly & (lengths == 7)
+        annual = ~quarterly & (lengths == 4)
+        other = ~(quarterly | monthly | annual)
+
+        if quarterly.any():
+            dates[quarterly] = pd.PeriodIndex(
+                periods[quarterly], freq="Q"
+            ).end_time.normalize()
+        if monthly.any():
+            dates[monthly] = pd.to_datetime(periods[monthly] + "-01", format="%Y-%m-%d")
+        if annual.any():
+            dates[annual] = pd.to_datetime(periods[annual], format="%Y")
+        if other.any():
+            # Parsed one by one, as before vectorizing: a batch call infers
+            # a single format from the first value and misreads the rest
+            dates[other] = periods[other].map(pd.to_datetime)
+        return dates
+
     def _parse_period(self, period: str) -> pd.Timestamp:
-        """Convert BIS period string to timestamp."""
-        # Handle quarterly format (e.g., '2023-Q1')
-        if "-Q" in period:
-            return pd.Period(period, freq="Q").end_time.normalize()
-        # Handle monthly format (e.g., '2023-01')
-        elif len(period) == 7:
-            return pd.Timestamp(f"{period}-01")
-        # Handle annual format (e.g., '2023')
-        elif len(period) == 4:
-            return pd.Timestamp(f"{period}-01-01")
-        else:
-            return pd.Timestamp(period)
+        """Convert one BIS period string to a timestamp.
+
+        Single-value form of :meth:`_parse_periods`, so the two cannot
+        date a period differently.
+        """
+        return self._parse_periods(pd.Series([period], dtype=object)).iloc[0]
     
     def get_credit_to_gdp(self, country: str, start_date: str | None = None,
                           end_date: str | None = None) -> pd.DataFrame:
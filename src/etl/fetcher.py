@@ -1,5 +1,8 @@
 """Data fetcher that orchestrates pulling data from all sources."""
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pandas as pd
 from typing import Literal
@@ -7,6 +10,13 @@ from typing import Literal
 from ..config import get_series_config, get_all_series, RAW_DATA_PATH
 from ..data_sources import FredClient, BISClient, WorldBankClient, NYFedClient, YFinanceClient
 from ..data_sources.base import BaseClient
+from .storage import PARQUET_COMPRESSION
+
+
+# A cached fetch whose range closed this long ago is effectively immutable
+# (bar rare revisions), so it is kept far longer than a range touching today.
+HISTORICAL_RANGE_LAG = pd.Timedelta(days=30)
+HISTORICAL_CACHE_TTL = 90 * 24 * 3600
 
 
 class SourceContractError(ValueError):
@@ -16,33 +26,53 @@ class SourceContractError(ValueError):
 class DataFetcher:
     """Orchestrates data fetching from all configured sources."""
 
-    def __init__(self, fred_api_key: str | None = None) -> None:
+    def __init__(self, fred_api_key: str | None = None,
+                 cache_path: Path | None = None,
+                 cache_ttl: float | None = None,
+                 historical_cache_ttl: float | None = HISTORICAL_CACHE_TTL) -> None:
+        """
+        Args:
+            fred_api_key: FRED API key (defaults to FRED_API_KEY)
+            cache_path: Directory for the on-disk fetch cache. Caching is off
+                unless this is set, so scheduled publishes always go upstream.
+            cache_ttl: Maximum age in seconds of a cached fetch (None = no
+                expiry).
+            historical_cache_ttl: Minimum age in seconds kept for ranges that
+                ended over HISTORICAL_RANGE_LAG ago (None = cache_ttl applies
+                to every range).
+        """
         self._clients: dict[str, BaseClient] = {}
         self._fred_api_key = fred_api_key
         self._source_metadata_cache: dict[tuple[str, str], dict] = {}
+        self._cache_path = cache_path
+        self._cache_ttl = cache_ttl
+        self._historical_cache_ttl = historical_cache_ttl
+        self._clients_lock = threading.Lock()
 
     def _get_client(self, source: str) -> BaseClient:
         """Get or create a client for the given source."""
-        if source not in self._clients:
-            cache_path = RAW_DATA_PATH / source
-            
-            if source == "fred":
-                self._clients[source] = FredClient(
-                    api_key=self._fred_api_key,
-                    cache_path=cache_path
-                )
-            elif source == "bis":
-                self._clients[source] = BISClient(cache_path=cache_path)
-            elif source == "worldbank":
-                self._clients[source] = WorldBankClient(cache_path=cache_path)
-            elif source == "nyfed":
-                self._clients[source] = NYFedClient(cache_path=cache_path)
-            elif source == "yfinance":
-                self._clients[source] = YFinanceClient(cache_path=cache_path)
-            else:
-                raise ValueError(f"Unknown data source: {source}")
-        
-        return self._clients[source]
+        # fetch_multiple runs fetches on worker threads; create each client once
+        with self._clients_lock:
+            if source not in self._clients:
+                cache_path = RAW_DATA_PATH / source
+
+                if source == "fred":
+                    self._clients[source] = FredClient(
+                        api_key=self._fred_api_key,
+                        cache_path=cache_path
+                    )
+                elif source == "bis":
+                    self._clients[source] = BISClient(cache_path=cache_path)
+                elif source == "worldbank":
+                    self._clients[source] = WorldBankClient(cache_path=cache_path)
+                elif source == "nyfed":
+                    self._clients[source] = NYFedClient(cache_path=cache_path)
+                elif source == "yfinance":
+                    self._clients[source] = YFinanceClient(cache_path=cache_path)
+                else:
+                    raise ValueError(f"Unknown data source: {source}")
+
+            return self._clients[source]
     
     def fetch_series(self, series_id: str, start_date: str | None = None,
                      end_date: str | None = None) -> pd.DataFrame:
@@ -59,6 +89,10 @@ class DataFetcher:
         config = get_series_config(series_id)
         if not config:
             raise ValueError(f"Series '{series_id}' not found in configuration")
+
+        cached = self._load_cached(series_id, start_date, end_date)
+        if cached is not None:
+            return cached
         
         source = config["source"]
         source_id = config["source_id"]
@@ -79,9 +113,68 @@ class DataFetcher:
         df["frequency"] = config.get("frequency", "")
         df["type"] = config.get("type", "")
         df["unit"] = config.get("unit", "")
-        
+
+        self._save_cached(df, series_id, start_date, end_date)
         return df
 
+    def _cache_file(self, series_id: str, start_date: str | None,
+                    end_date: str | None) -> Path | None:
+        """Cache file for one (series, start, end) request, if caching is on.
+
+        Each series gets its own directory so :meth:`_save_cached` can drop
+        the files of earlier ranges without matching other series' names.
+        """
+        if self._cache_path is None:
+            return None
+        clean_id = series_id.replace(":", "_").replace("/", "_")
+        return self._cache_path / clean_id / f"{start_date or 'min'}_{end_date or 'max'}.parquet"
+
+    def _load_cached(self, series_id: str, start_date: str | None,
+                     end_date: str | None) -> pd.DataFrame | None:
+        """Return a cached fetch if present and younger than the TTL.
+
+        A hit skips the upstream call and the source-contract check; the
+        contract was enforced when the cached frame was fetched.
+        """
+        cache_file = self._cache_file(series_id, start_date, end_date)
+        if cache_file is None or not cache_file.exists():
+            return None
+        max_age = self._cache_max_age(end_date)
+        if max_age is not None:
+            age = time.time() - cache_file.stat().st_mtime
+            if age >= max_age:
+                return None
+        return pd.read_parquet(cache_file)
+
+    def _cache_max_age(self, end_date: str | None) -> float | None:
+        """TTL for a cached range: closed historical ranges live longer."""
+        if self._cache_ttl is None:
+            return None
+        if end_date is not None and self._historical_cache_ttl is not None:
+            cutoff = pd.Timestamp.now().normalize() - HISTORICAL_RANGE_LAG
+            if pd.Timestamp(end_date) < cutoff:
+                return max(self._cache_ttl, self._historical_cache_ttl)
+        return self._cache_ttl
+
+    def _save_cached(self, df: pd.DataFrame, series_id: str,
+                     start_date: str | None, end_date: str | None) -> None:
+        """Write a fetched frame through to the cache, if caching is on.
+
+        Only the latest range is kept per series: ranges that end today
+        shift every day, so keeping every request would grow without bound.
+        """
+        cache_file = self._cache_file(series_id, start_date, end_date)
+        if cache_file is None:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        temporary_path = cache_file.with_name(f".{cache_file.name}.tmp")
+        df.to_parquet(temporary_path, index=False, compression=PARQUET_COMPRESSION)
+        temporary_path.replace(cache_file)
+        for stale in cache_file.parent.glob("*.parquet"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+
     def _validate_source_contract(
         self,
         series_id: str,
@@ -145,26 +238,34 @@ class DataFetcher:
     
     def fetch_multiple(self, series_ids: list[str], start_date: str | None = None,
                        end_date: str | None = None,
-                       retries: int = 2) -> dict[str, pd.DataFrame]:
-        """Fetch multiple series.
+                       retries: int = 2,
+                       max_workers: int = 4) -> dict[str, pd.DataFrame]:
+        """Fetch multiple series concurrently.
+
+        Fetches are network-bound, so a small thread pool overlaps the
+        upstream round trips; wall time tracks the slowest series rather
+        than the sum. The pool is kept small to stay well inside FRED's
+        per-key rate limit.
 
         Failed fetches are retried with backoff; rate limits and transient
         network errors (Yahoo throttling, FRED hiccups) usually clear within
         seconds, and one missed asset otherwise drops it from the publish.
 
+        Args:
+            series_ids: Series IDs from config/series.yml
+            start_date: Optional start date
+            end_date: Optional end date
+            retries: Retries per series after the first attempt
+            max_workers: Concurrent fetches (1 = sequential)
+
         Returns:
-            Dict mapping series_id to DataFrame
+            Dict mapping series_id to DataFrame, in ``series_ids`` order
         """
-        results = {}
-        errors = {}
-
-        for series_id in series_ids:
+        def fetch_one(series_id: str) -> pd.DataFrame | Exception:
             last_error: Exception | None = None
             for attempt in range(retries + 1):
                 try:
-                    results[series_id] = self.fetch_series(series_id, start_date, end_date)
-                    last_error = None
-                    break
+                    return self.fetch_series(series_id, start_date, end_date)
                 except Exception as e:
                     last_error = e
                     if isinstance(e, SourceContractError):
@@ -173,9 +274,23 @@ class DataFetcher:
                         delay = 2 * (attempt + 1)
                         print(f"Warning: fetch {series_id} failed ({e}), retrying in {delay}s")
                         time.sleep(delay)
-            if last_error is not None:
-                errors[series_id] = str(last_error)
-                print(f"Warning: Failed to fetch {series_id}: {last_error}")
+            return last_error
+
+        unique_ids = list(dict.fromkeys(series_ids))
+        if max_workers <= 1 or len(unique_ids) <= 1:
+            outcomes = [fetch_one(series_id) for series_id in unique_ids]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                outcomes = list(pool.map(fetch_one, unique_ids))
+
+        results = {}
+        errors = {}
+        for series_id, outcome in zip(unique_ids, outcomes):
+            if isinstance(outcome, Exception):
+                errors[series_id] = str(outcome)
+                print(f"Warning: Failed to fetch {series_id}: {outcome}")
+            else:
+                results[series_id] = outcome
         
         if errors:
             print(f"\nFailed to fetch {len(errors)} series: {list(errors.keys())}")
@@ -1,11 +1,17 @@
 """Data storage layer for raw and curated data."""
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
 import json
 
 from ..config import RAW_DATA_PATH, CURATED_DATA_PATH
 
+# zstd compresses these float/date columns noticeably smaller than pyarrow's
+# snappy default and still decodes fast; readers detect the codec per file.
+PARQUET_COMPRESSION = "zstd"
+
 
 class DataStorage:
     """Handles storage and retrieval of time series data."""
@@ -36,16 +42,36 @@ class DataStorage:
         clean_id = series_id.replace(":", "_").replace("/", "_")
         file_path = source_path / f"{clean_id}.parquet"
         
-        df.to_parquet(file_path, index=False)
+        df = self._sorted_by_date(df)
+        df.to_parquet(file_path, index=False, compression=PARQUET_COMPRESSION)
         return file_path
+
+    @staticmethod
+    def _sorted_by_date(df: pd.DataFrame) -> pd.DataFrame:
+        """Order a frame by date before writing so readers rarely need to sort.
+
+        The sort is stable, so rows sharing a date keep their order; frames
+        without a date column, or already in order, are written as given.
+        """
+        if "date" not in df.columns or df["date"].is_monotonic_increasing:
+            return df
+        return df.sort_values("date", kind="stable", ignore_index=True)
     
-    def load_raw(self, source: str, series_id: str) -> pd.DataFrame | None:
-        """Load raw data from parquet file."""
+    def load_raw(self, source: str, series_id: str,
+                 columns: list[str] | None = None) -> pd.DataFrame | None:
+        """Load raw data from parquet file.
+
+        Args:
+            source: Data source name (fred, bis, etc.)
+            series_id: Series identifier
+            columns: Optional subset of columns to read; unread columns are
+                never decoded, which matters for wide metadata columns.
+        """
         clean_id = series_id.replace(":", "_").replace("/", "_")
         file_path = self.raw_path / source / f"{clean_id}.parquet"
         
         if file_path.exists():
-            return pd.read_parquet(file_path)
+            return pd.read_parquet(file_path, columns=columns)
         return None
     
     def append_raw(self, df: pd.DataFrame, source: str, series_id: str) -> Path:
@@ -131,7 +157,9 @@ class DataStorage:
         category_path.mkdir(parents=True, exist_ok=True)
         file_path = category_path / f"{name}.parquet"
         temporary_path = category_path / f".{name}.parquet.tmp"
-        combined.to_parquet(temporary_path, index=False)
+        combined.to_parquet(
+            temporary_path, index=False, compression=PARQUET_COMPRESSION
+        )
         temporary_path.replace(file_path)
         return file_path
     
@@ -171,7 +199,8 @@ class DataStorage:
         category_path.mkdir(parents=True, exist_ok=True)
         
         file_path = category_path / f"{name}.parquet"
-        df.to_parquet(file_path, index=False)
+        df = self._sorted_by_date(df)
+        df.to_parquet(file_path, index=False, compression=PARQUET_COMPRESSION)
         
         # Save metadata if provided
         if metadata:
@@ -220,14 +249,73 @@ class DataStorage:
     
     def get_latest_date(self, source: str, series_id: str) -> pd.Timestamp | None:
         """Get the latest date in a raw series."""
-        df = self.load_raw(source, series_id)
-        if df is not None and not df.empty:
-            return pd.Timestamp(df["date"].max())
-        return None
+        date_range = self.get_date_range(source, series_id)
+        return date_range[1] if date_range is not None else None
     
     def get_date_range(self, source: str, series_id: str) -> tuple[pd.Timestamp, pd.Timestamp] | None:
-        """Get the date range of a raw series."""
-        df = self.load_raw(source, series_id)
-        if df is not None and not df.empty:
+        """Get the date range of a raw series.
+
+        Read from the parquet footer's column statistics when available, so
+        freshness checks do not decode the data pages.
+        """
+        clean_id = series_id.replace(":", "_").replace("/", "_")
+        file_path = self.raw_path / source / f"{clean_id}.parquet"
+        if not file_path.exists():
+            return None
+
+        bounds = self._date_bounds_from_metadata(file_path)
+        if bounds is not None:
+            return bounds
+
+        df = pd.read_parquet(file_path, columns=["date"])
+        if not df.empty:
             return (pd.Timestamp(df["date"].min()), pd.Timestamp(df["date"].max()))
         return None
+
+    @staticmethod
+    def _date_bounds_from_metadata(
+        file_path: Path,
+    ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """Min/max of a date column from row-group statistics, if complete.
+
+        Returns None whenever the statistics cannot answer exactly (no date
+        column, non-temporal type, missing stats, no non-null dates, or a
+        tz-aware value without a zone to convert to), so the caller falls
+        back to reading the column.
+        """
+        parquet_file = pq.ParquetFile(file_path)
+        schema = parquet_file.schema_arrow
+        if "date" not in schema.names:
+            return None
+        date_type = schema.field("date").type
+        if not (pa.types.is_timestamp(date_type) or pa.types.is_date(date_type)):
+            return None
+
+        column_index = parquet_file.schema.names.index("date")
+        metadata = parquet_file.metadata
+        lows, highs = [], []
+        for group in range(metadata.num_row_groups):
+            column = metadata.row_group(group).column(column_index)
+            statistics = column.statistics
+            if statistics is None:
+                return None
+            if not statistics.has_min_max:
+                if statistics.null_count == column.num_values:
+                    continue  # all-null row group contributes nothing
+                return None
+            lows.append(statistics.min)
+            highs.append(statistics.max)
+        if not highs:
+            return None
+        low, high = pd.Timestamp(min(lows)), pd.Timestamp(max(highs))
+
+        # Statistics of a tz-aware column come back in UTC; report them in
+        # the column's own zone so the calendar day matches a column read
+        zone = getattr(date_type, "tz", None)
+        if zone:
+            if low.tzinfo is None:
+                low, high = low.tz_localize("UTC"), high.tz_localize("UTC")
+            return (low.tz_convert(zone), high.tz_convert(zone))
+        if low.tzinfo is not None:
+            return None
+        return (low, high)
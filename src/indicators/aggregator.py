@@ -1,4 +1,6 @@
 """Aggregator for computing composite indices."""
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 from ..config import get_index_config, get_all_indices, get_country_weights
@@ -304,20 +306,59 @@ class Aggregator:
         
         return result.glci
     
-    def compute_all_indices(
+    def prefetch_components(
         self,
+        index_ids: list[str],
         start_date: str | None = None,
         end_date: str | None = None
+    ) -> None:
+        """Fetch every component series of ``index_ids`` once into the cache.
+
+        Series that fail here are left out of the cache, so the index that
+        needs them fetches again and reports the error itself.
+        """
+        needed = []
+        for index_id in index_ids:
+            for comp in get_index_config(index_id).get("components", []):
+                cache_key = f"{comp['series']}_{start_date}_{end_date}"
+                if cache_key not in self._cache:
+                    needed.append(comp["series"])
+        needed = list(dict.fromkeys(needed))
+        if not needed:
+            return
+
+        fetched = self.fetcher.fetch_multiple(needed, start_date, end_date)
+        for series_id, df in fetched.items():
+            self._cache[f"{series_id}_{start_date}_{end_date}"] = df
+    
+    def compute_all_indices(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_workers: int = 4
     ) -> dict[str, pd.DataFrame]:
-        """Compute all configured indices."""
-        all_indices = get_all_indices()
+        """Compute all configured indices.
+
+        Many indices share inputs (Fed assets, TGA, RRP, spreads), so the
+        union of their component series is fetched once up front; each
+        index then reads from the component cache. Indices run on a small
+        thread pool (max_workers=1 runs them sequentially) and results keep
+        the configuration order.
+        """
+        all_indices = list(get_all_indices())
+        self.prefetch_components(all_indices, start_date, end_date)
         results = {}
-        
-        for index_id in all_indices:
-            try:
-                results[index_id] = self.compute_index(index_id, start_date, end_date)
-            except Exception as e:
-                print(f"Warning: Failed to compute {index_id}: {e}")
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                index_id: pool.submit(self.compute_index, index_id, start_date, end_date)
+                for index_id in all_indices
+            }
+            for index_id, future in futures.items():
+                try:
+                    results[index_id] = future.result()
+                except Exception as e:
+                    print(f"Warning: Failed to compute {index_id}: {e}")
         
         return results
     
@@ -883,21 +883,19 @@ class BacktestComputer:
         )
 
         timeline = []
-        for date, row in regime_df.iterrows():
-            if pd.notna(row["regime"]):
-                raw = values.loc[date] if date in values.index else None
-                timeline.append(
-                    {
-                        "date": date.strftime("%Y-%m-%d"),
-                        "regime": REGIME_LABELS[int(row["regime"])],
-                        "zscore": round(float(row["zscore"]), 3)
-                        if pd.notna(row["zscore"])
-                        else None,
-                        "value": round(float(raw), 4)
-                        if raw is not None and pd.notna(raw)
-                        else None,
-                    }
-                )
+        # Plain tuples: no per-row Series is built for the weekly timeline
+        for date, regime, zscore in valid[["regime", "zscore"]].itertuples(name=None):
+            raw = values.loc[date] if date in values.index else None
+            timeline.append(
+                {
+                    "date": date.strftime("%Y-%m-%d"),
+                    "regime": REGIME_LABELS[int(regime)],
+                    "zscore": round(float(zscore), 3) if pd.notna(zscore) else None,
+                    "value": round(float(raw), 4)
+                    if raw is not None and pd.notna(raw)
+                    else None,
+                }
+            )
 
         return {
             "name": name,
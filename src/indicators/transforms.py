@@ -138,14 +138,15 @@ def compute_zscore(
 
     values = _as_series(df[value_col])
 
+    # Build the window once and take both moments from it. pandas' rolling
+    # kernels are already compiled and numerically stable; a cumsum-of-squares
+    # variance would lose precision on level series such as balance sheets.
     if window:
-        rolling_mean = values.rolling(window=window, min_periods=min_periods).mean()
-        rolling_std = values.rolling(window=window, min_periods=min_periods).std()
+        windowed = values.rolling(window=window, min_periods=min_periods)
     else:
-        rolling_mean = values.expanding(min_periods=min_periods).mean()
-        rolling_std = values.expanding(min_periods=min_periods).std()
+        windowed = values.expanding(min_periods=min_periods)
 
-    _assign_col(df, "zscore", (values - rolling_mean) / rolling_std)
+    _assign_col(df, "zscore", (values - windowed.mean()) / windowed.std())
     return df
 
 
@@ -251,11 +252,13 @@ def detect_regime(
         df = compute_zscore(df, value_col)
     
     low, high = thresholds
-    finite = np.isfinite(df["zscore"])
-    df["regime"] = np.nan
-    df.loc[finite, "regime"] = 0
-    df.loc[finite & (df["zscore"] < low), "regime"] = -1
-    df.loc[finite & (df["zscore"] > high), "regime"] = 1
+    zscore = df["zscore"].to_numpy(dtype=float)
+    # Single pass over the array; non-finite z-scores stay unclassified
+    df["regime"] = np.select(
+        [~np.isfinite(zscore), zscore < low, zscore > high],
+        [np.nan, -1.0, 1.0],
+        default=0.0,
+    )
     
     return df
 
@@ -471,32 +474,29 @@ def standardize_series(
 
     if method == "zscore":
         if window:
-            mean = values.rolling(window=window, min_periods=20).mean()
-            std = values.rolling(window=window, min_periods=20).std()
+            windowed = values.rolling(window=window, min_periods=20)
         else:
-            mean = values.expanding(min_periods=20).mean()
-            std = values.expanding(min_periods=20).std()
-        standardized = (values - mean) / std
+            windowed = values.expanding(min_periods=20)
+        standardized = (values - windowed.mean()) / windowed.std()
 
     elif method == "minmax":
         if window:
-            min_val = values.rolling(window=window, min_periods=20).min()
-            max_val = values.rolling(window=window, min_periods=20).max()
+            windowed = values.rolling(window=window, min_periods=20)
         else:
-            min_val = values.expanding(min_periods=20).min()
-            max_val = values.expanding(min_periods=20).max()
+            windowed = values.expanding(min_periods=20)
+        min_val = windowed.min()
+        max_val = windowed.max()
         standardized = (values - min_val) / (max_val - min_val)
 
     elif method == "robust":
         # Use median and IQR for robustness to outliers
         if window:
-            median = values.rolling(window=window, min_periods=20).median()
-            q75 = values.rolling(window=window, min_periods=20).quantile(0.75)
-            q25 = values.rolling(window=window, min_periods=20).quantile(0.25)
+            windowed = values.rolling(window=window, min_periods=20)
         else:
-            median = values.expanding(min_periods=20).median()
-            q75 = values.expanding(min_periods=20).quantile(0.75)
-            q25 = values.expanding(min_periods=20).quantile(0.25)
+            windowed = values.expanding(min_periods=20)
+        median = windowed.median()
+        q75 = windowed.quantile(0.75)
+        q25 = windowed.quantile(0.25)
         iqr = q75 - q25
         standardized = (values - median) / iqr
     else:
@@ -138,3 +138,35 @@ class TestUnknownIndex:
     def test_raises_for_unconfigured_index(self):
         with pytest.raises(ValueError, match="not found"):
             Aggregator(fetcher=StubFetcher({})).compute_index("nonexistent_index")
+
+
+class TestComputeAllIndices:
+    def test_parallel_run_matches_sequential_and_skips_failures(self, net_liquidity_world):
+        fetcher, expected_latest = net_liquidity_world
+
+        parallel = Aggregator(fetcher=fetcher).compute_all_indices(max_workers=4)
+        sequential = Aggregator(fetcher=fetcher).compute_all_indices(max_workers=1)
+
+        assert list(parallel) == list(sequential)
+        assert "fed_net_liquidity" in parallel
+        assert parallel["fed_net_liquidity"]["value"].iloc[-1] == pytest.approx(expected_latest)
+        for index_id, df in parallel.items():
+            pd.testing.assert_frame_equal(df, sequential[index_id])
+
+    def test_shared_components_are_fetched_once(self, net_liquidity_world):
+        fetcher, _ = net_liquidity_world
+        calls: list[str] = []
+        fetch_series = fetcher.fetch_series
+
+        def counting_fetch(series_id, start_date=None, end_date=None):
+            calls.append(series_id)
+            return fetch_series(series_id, start_date, end_date)
+
+        fetcher.fetch_series = counting_fetch
+        agg = Aggregator(fetcher=fetcher)
+        # fed_total_assets is a component of both indices
+        agg.prefetch_components(["fed_net_liquidity", "global_cb_assets"])
+        agg.compute_index("fed_net_liquidity")
+
+        assert calls.count("fed_total_assets") == 1
+        assert calls.count("fed_treasury_general_account") == 1
@@ -0,0 +1,164 @@
+"""Tests for the API response caches and shared GLCI compute state."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import server
+from src.api.server import ResponseCache
+from src.config import get_all_series, reload_config
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr("src.api.server.time.monotonic", fake)
+    return fake
+
+
+def _json(body: bytes = b"{}", status_code: int = 200):
+    return server.Response(content=body, status_code=status_code,
+                           media_type="application/json")
+
+
+class TestResponseCache:
+    def test_hit_returns_stored_status_and_body(self, clock):
+        cache = ResponseCache(ttl_seconds=3600)
+        cache.set(("series", "a"), _json(b'{"id": "a"}'))
+
+        hit = cache.get(("series", "a"))
+
+        assert hit is not None
+        assert hit.status_code == 200
+        assert hit.body == b'{"id": "a"}'
+
+    def test_not_found_expires_after_not_found_ttl(self, clock):
+        cache = ResponseCache(ttl_seconds=3600, not_found_ttl_seconds=60)
+        cache.set(("series", "ok"), _json())
+        cache.set(("series", "missing"), server._not_found("No data"))
+
+        clock.now += 59
+        assert cache.get(("series", "missing")).status_code == 404
+
+        clock.now += 1
+        assert cache.get(("series", "missing")) is None
+        assert cache.get(("series", "ok")) is not None
+
+    def test_oldest_entry_is_evicted_at_max_size(self, clock):
+        cache = ResponseCache(max_entries=2)
+        cache.set(("a",), _json())
+        cache.set(("b",), _json())
+        cache.set(("c",), _json())
+
+        assert cache.get(("a",)) is None
+        assert cache.get(("b",)) is not None
+        assert cache.get(("c",)) is not None
+
+    def test_overwriting_a_key_does_not_evict(self, clock):
+        cache = ResponseCache(max_entries=2)
+        cache.set(("a",), _json())
+        cache.set(("b",), _json())
+        cache.set(("b",), _json(b'{"v": 2}'))
+
+        assert cache.get(("a",)) is not None
+        assert cache.get(("b",)).body == b'{"v": 2}'
+
+
+class TestCachedSeriesEndpoint:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        calls = []
+
+        def fake_fetch(series_id, start_date=None, end_date=None):
+            calls.append(series_id)
+            return pd.DataFrame({
+                "date": pd.to_datetime(["2024-01-05", "2024-01-12"]),
+                "value": [1.0, 2.0],
+            })
+
+        monkeypatch.setattr(server.fetcher, "fetch_series", fake_fetch)
+        server.response_cache.clear()
+        yield TestClient(server.app), calls
+        server.response_cache.clear()
+
+    def test_repeat_request_is_served_from_cache(self, client):
+        test_client, calls = client
+        series_id = next(iter(get_all_series()))
+        url = f"/api/series/{series_id}?start=2024-01-01&end=2024-02-01"
+
+        first = test_client.get(url)
+        second = test_client.get(url)
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert [p["value"] for p in second.json()["data"]] == [1.0, 2.0]
+        assert calls == [series_id]
+
+    def test_different_range_misses_cache(self, client):
+        test_client, calls = client
+        series_id = next(iter(get_all_series()))
+
+        test_client.get(f"/api/series/{series_id}?start=2024-01-01&end=2024-02-01")
+        test_client.get(f"/api/series/{series_id}?start=2024-01-01&end=2024-03-01")
+
+        assert calls == [series_id, series_id]
+
+
+class TestListBodies:
+    @pytest.fixture
+    def client(self):
+        yield TestClient(server.app)
+        # Drop any body built from a patched config
+        reload_config()
+
+    def test_series_list_is_rebuilt_after_config_reload(self, client, monkeypatch):
+        before = client.get("/api/series").json()
+        assert {item["id"] for item in before} == set(get_all_series())
+
+        monkeypatch.setattr(server, "get_all_series", lambda: {
+            "only_series": {"source": "fred", "description": "Only"},
+        })
+        assert client.get("/api/series").json() == before
+
+        reload_config()
+        after = client.get("/api/series").json()
+
+        assert [item["id"] for item in after] == ["only_series"]
+        assert after[0]["source"] == "FRED"
+
+
+class TestGLCIComputeLock:
+    def test_concurrent_computes_do_not_overlap(self, monkeypatch):
+        active = []
+        overlaps = []
+
+        def fake_compute(start, end=None, **kwargs):
+            active.append(start)
+            if len(active) > 1:
+                overlaps.append(tuple(active))
+            time.sleep(0.02)
+            active.remove(start)
+            return start
+
+        monkeypatch.setattr(server.glci_computer, "compute", fake_compute)
+        threads = [
+            threading.Thread(target=server._compute_glci, args=(f"2024-01-0{i}",))
+            for i in range(1, 5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == []
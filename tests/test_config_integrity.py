@@ -5,7 +5,13 @@ referencing a series that was renamed or removed.
 """
 import pytest
 
-from src.config import get_all_indices, get_all_series, get_index_config
+from src.config import (
+    get_all_indices,
+    get_all_series,
+    get_index_config,
+    load_config,
+    reload_config,
+)
 from src.indicators.risk_metrics import ASSET_CONFIG
 
 VALID_SOURCES = {"fred", "bis", "worldbank", "nyfed", "yfinance"}
@@ -82,3 +88,16 @@ class TestRiskAssetConfig:
             assert asset_id in all_series, (
                 f"Risk asset '{asset_id}' not defined in series.yml"
             )
+
+
+class TestConfigCache:
+    def test_yaml_is_parsed_once_until_reloaded(self):
+        config = load_config()
+        assert load_config() is config
+        series = get_all_series()
+
+        reload_config()
+
+        assert load_config() is not config
+        assert get_all_series() is not series
+        assert get_all_series() == series
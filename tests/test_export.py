@@ -1,5 +1,6 @@
 """Tests for the static JSON export layer (scripts/export_to_json.py)."""
 import json
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -13,6 +14,7 @@ from scripts.export_to_json import (
     export_glci_freshness,
     export_glci_trust,
     export_indices_list,
+    export_risk_metrics,
     fmt_date,
     validate_required_exports,
     write_json,
@@ -33,12 +35,108 @@ class TestFmtDate:
         assert fmt_date(float("nan")) == ""
 
 
+class TestFmtDates:
+    def test_matches_scalar_formatter(self):
+        values = [
+            pd.Timestamp("2024-03-15 13:45:00"),
+            "2024-03-16T01:00:00",
+            float("nan"),
+        ]
+        assert export_module.fmt_dates(values) == [fmt_date(v) for v in values]
+
+    def test_mixed_string_formats_match_scalar_formatter(self):
+        values = [
+            "2024-03-16T01:00:00",
+            "2024-03-17",
+            "2024/03/18",
+            pd.Timestamp("2024-03-19"),
+            None,
+            "not a date",
+        ]
+        assert export_module.fmt_dates(values) == [fmt_date(v) for v in values]
+        assert export_module.fmt_dates(values)[:3] == [
+            "2024-03-16",
+            "2024-03-17",
+            "2024/03/18",
+        ]
+
+    def test_empty_column(self):
+        assert export_module.fmt_dates(pd.Series([], dtype="datetime64[ns]")) == []
+
+    def test_timezone_and_pre_epoch_dates_keep_wall_clock_day(self):
+        values = pd.Series(
+            pd.to_datetime(["2024-03-15 23:30", "1965-06-01 18:00"]).tz_localize(
+                "US/Eastern"
+            )
+        )
+        assert export_module.fmt_dates(values) == ["2024-03-15", "1965-06-01"]
+
+
+class TestBuildDataPoints:
+    def test_missing_values_are_omitted(self):
+        df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2024-01-05", "2024-01-12", "2024-01-19"]),
+                "value": [1, None, 3.5],
+            }
+        )
+        assert export_module.build_data_points(df) == [
+            {"date": "2024-01-05", "value": 1.0},
+            {"date": "2024-01-19", "value": 3.5},
+        ]
+
+
+class TestRoundColumn:
+    def test_matches_builtin_round_and_fills_missing(self):
+        values = pd.Series([5.555, 12.345, float("nan"), -0.125])
+        assert export_module.round_column(values, 2, missing=0) == [
+            round(5.555, 2),
+            round(12.345, 2),
+            0,
+            round(-0.125, 2),
+        ]
+
+
+class TestEnsureSorted:
+    def test_sorted_frame_is_returned_unchanged(self):
+        df = pd.DataFrame({"date": pd.date_range("2024-01-01", periods=3)})
+        assert export_module.ensure_sorted(df) is df
+
+    def test_unsorted_frame_is_sorted(self):
+        df = pd.DataFrame(
+            {"date": pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02"])}
+        )
+        result = export_module.ensure_sorted(df)
+        assert result["date"].is_monotonic_increasing
+        assert result.index.tolist() == [1, 2, 0]
+
+
 class TestWriteJson:
     def test_creates_parent_directories(self, tmp_path):
         target = tmp_path / "a" / "b" / "index.json"
         write_json(target, {"x": 1})
         assert json.loads(target.read_text()) == {"x": 1}
 
+    def test_compact_by_default(self, tmp_path):
+        target = tmp_path / "index.json"
+        write_json(target, {"data": [{"date": "2024-01-01", "value": 1.0}]})
+        assert target.read_text() == '{"data":[{"date":"2024-01-01","value":1.0}]}'
+
+    def test_gzip_copy_matches_plain_output(self, tmp_path, monkeypatch):
+        import gzip
+
+        monkeypatch.setattr(export_module, "JSON_GZIP", True)
+        target = tmp_path / "index.json"
+        write_json(target, {"x": [1, 2]})
+        compressed = tmp_path / "index.json.gz"
+        assert gzip.decompress(compressed.read_bytes()) == target.read_bytes()
+
+    def test_pretty_output_is_indented(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(export_module, "JSON_INDENT", 2)
+        target = tmp_path / "index.json"
+        write_json(target, {"x": 1})
+        assert target.read_text() == '{\n  "x": 1\n}'
+
     def test_compatibility_index_id_uses_current_display_name(self, tmp_path):
         export_indices_list(get_all_indices(), tmp_path)
         payload = json.loads((tmp_path / "api" / "indices" / "index.json").read_text())
@@ -115,9 +213,92 @@ class TestExportGlciRegimeHistory:
         assert payload["periods"][0]["regime"] == "tight"
         assert payload["periods"][0]["start"] == "2026-01-09"
         assert payload["periods"][1]["regime"] == "loose"
+        assert payload["counts"] == {"tight": 2, "loose": 2}
         assert payload["current"] == "loose"
 
 
+class TestLoadWeights:
+    def test_rewritten_weights_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "glci_weights.json"
+        path.write_text('{"pillar_weights": {"liquidity": 1.0}}')
+        first = export_module._load_weights(str(path), path.stat().st_mtime_ns)
+        assert first is export_module._load_weights(
+            str(path), path.stat().st_mtime_ns
+        )
+
+        path.write_text('{"pillar_weights": {"credit": 1.0}}')
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        second = export_module._load_weights(str(path), path.stat().st_mtime_ns)
+        assert second == {"pillar_weights": {"credit": 1.0}}
+
+
+class TestSnapshotLinking:
+    def test_snapshot_file_is_hard_linked(self, tmp_path):
+        src = tmp_path / "index.json"
+        src.write_text("{}")
+        export_module._link_or_copy(str(src), str(tmp_path / "snap.json"))
+        assert (tmp_path / "snap.json").stat().st_ino == src.stat().st_ino
+
+    def test_falls_back_to_copy_when_linking_fails(self, tmp_path, monkeypatch):
+        def refuse(src, dst):
+            raise OSError("cross-device link")
+
+        monkeypatch.setattr(export_module.os, "link", refuse)
+        src = tmp_path / "index.json"
+        src.write_text('{"x": 1}')
+        export_module._link_or_copy(str(src), str(tmp_path / "snap.json"))
+        assert (tmp_path / "snap.json").read_text() == '{"x": 1}'
+        assert (tmp_path / "snap.json").stat().st_ino != src.stat().st_ino
+
+
+class TestExportRiskMetrics:
+    def test_missing_metrics_use_dashboard_defaults(self, tmp_path):
+        storage = DataStorage(
+            raw_path=tmp_path / "raw",
+            curated_path=tmp_path / "curated",
+        )
+        storage.save_curated(
+            pd.DataFrame(
+                {
+                    "asset_id": ["spx", "btc"],
+                    "name": ["S&P 500", "Bitcoin"],
+                    "current_sharpe": [1.234, float("nan")],
+                    "annualized_return": [8.0, 40.0],
+                    "annualized_volatility": [15.0, 60.0],
+                    "max_drawdown": [-20.0, -75.0],
+                    "sharpe_tight": [0.5, float("nan")],
+                    "sharpe_neutral": [1.0, 0.8],
+                    "sharpe_loose": [1.5, 2.0],
+                    "correlation_with_glci": [0.12345, float("nan")],
+                }
+            ),
+            "risk",
+            "risk_metrics",
+        )
+
+        assert export_risk_metrics(storage, tmp_path / "export") is True
+
+        payload = json.loads(
+            (tmp_path / "export" / "api" / "risk" / "index.json").read_text()
+        )
+        spx, btc = payload["assets"]
+        assert spx["category"] == "Other"
+        assert spx["current_sharpe"] == 1.23
+        assert spx["correlation_with_glci"] == 0.123
+        assert spx["return_by_regime"] == {
+            "tight": None,
+            "neutral": None,
+            "loose": None,
+        }
+        assert btc["current_sharpe"] == 0
+        assert btc["sharpe_by_regime"]["tight"] is None
+        assert btc["correlation_with_glci"] is None
+        assert payload["regime_matrix"]["sharpe_data"] == [
+            [0.5, 1.0, 1.5],
+            [None, 0.8, 2.0],
+        ]
+
+
 class TestValidateRequiredExports:
     def test_empty_directory_reports_all_paths_missing(self, tmp_path):
         errors = validate_required_exports(tmp_path)
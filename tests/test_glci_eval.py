@@ -0,0 +1,38 @@
+"""Tests for the GLCI evaluation script helpers."""
+
+import pandas as pd
+
+from notebooks.glci_eval import stress_episode_stats
+
+EPISODES = [
+    ("Covid", "2020-02-15", "2020-04-15"),
+    ("QT", "2022-01-01", "2022-12-31"),
+    ("Future", "2030-01-01", "2030-06-30"),
+]
+
+
+class TestStressEpisodeStats:
+    def test_episode_table_on_ns_dates(self):
+        glci_df = pd.DataFrame({
+            "date": pd.to_datetime(
+                ["2020-02-14", "2020-02-15", "2020-04-15", "2022-06-03", "2023-01-06"]
+            ).as_unit("ns"),
+            "value": [1.0, 2.0, 4.0, 10.0, 99.0],
+        })
+
+        stats = stress_episode_stats(glci_df, EPISODES)
+
+        assert stats.index.tolist() == ["Covid", "QT", "Future"]
+        assert stats["size"].tolist() == [2, 1, 0]
+        assert stats.loc["Covid", ["min", "max", "mean"]].tolist() == [2.0, 4.0, 3.0]
+        assert stats.loc["QT", "mean"] == 10.0
+
+    def test_episode_table_on_second_resolution_dates(self):
+        glci_df = pd.DataFrame({
+            "date": pd.to_datetime(["2020-03-06", "2022-03-04"]).as_unit("s"),
+            "value": [5.0, 7.0],
+        })
+
+        stats = stress_episode_stats(glci_df, EPISODES)
+
+        assert stats["size"].tolist() == [1, 1, 0]
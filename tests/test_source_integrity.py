@@ -146,6 +146,116 @@ class TestFredSourceContracts:
         assert client.series_calls == 0
 
 
+class TestFetchCache:
+    def test_warm_fetch_is_served_from_disk(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "src.etl.fetcher.get_series_config",
+            lambda _series_id: _boj_config(),
+        )
+        client = _FakeFredClient(_boj_metadata())
+        fetcher = DataFetcher(fred_api_key="offline-test-key", cache_path=tmp_path)
+        fetcher._clients["fred"] = client
+
+        first = fetcher.fetch_series("boj_total_assets", "2024-01-01")
+        second = fetcher.fetch_series("boj_total_assets", "2024-01-01")
+
+        pd.testing.assert_frame_equal(first, second)
+        assert client.series_calls == 1
+        assert client.info_calls == 1
+
+    def test_expired_or_different_range_goes_upstream(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "src.etl.fetcher.get_series_config",
+            lambda _series_id: _boj_config(),
+        )
+        client = _FakeFredClient(_boj_metadata())
+        fetcher = DataFetcher(
+            fred_api_key="offline-test-key", cache_path=tmp_path, cache_ttl=0
+        )
+        fetcher._clients["fred"] = client
+
+        fetcher.fetch_series("boj_total_assets", "2024-01-01")
+        fetcher.fetch_series("boj_total_assets", "2024-01-01")
+        fetcher.fetch_series("boj_total_assets", "2023-01-01")
+
+        assert client.series_calls == 3
+
+    def test_closed_historical_range_outlives_short_ttl(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "src.etl.fetcher.get_series_config",
+            lambda _series_id: _boj_config(),
+        )
+        client = _FakeFredClient(_boj_metadata())
+        fetcher = DataFetcher(
+            fred_api_key="offline-test-key", cache_path=tmp_path, cache_ttl=0
+        )
+        fetcher._clients["fred"] = client
+
+        fetcher.fetch_series("boj_total_assets", "2020-01-01", "2020-12-31")
+        fetcher.fetch_series("boj_total_assets", "2020-01-01", "2020-12-31")
+
+        assert client.series_calls == 1
+
+
+    def test_explicit_ttl_without_historical_floor_applies_to_old_ranges(
+        self, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(
+            "src.etl.fetcher.get_series_config",
+            lambda _series_id: _boj_config(),
+        )
+        client = _FakeFredClient(_boj_metadata())
+        fetcher = DataFetcher(
+            fred_api_key="offline-test-key",
+            cache_path=tmp_path,
+            cache_ttl=0,
+            historical_cache_ttl=None,
+        )
+        fetcher._clients["fred"] = client
+
+        fetcher.fetch_series("boj_total_assets", "2020-01-01", "2020-12-31")
+        fetcher.fetch_series("boj_total_assets", "2020-01-01", "2020-12-31")
+
+        assert client.series_calls == 2
+
+    def test_cache_keeps_only_the_latest_range_per_series(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "src.etl.fetcher.get_series_config",
+            lambda _series_id: _boj_config(),
+        )
+        fetcher = DataFetcher(fred_api_key="offline-test-key", cache_path=tmp_path)
+        fetcher._clients["fred"] = _FakeFredClient(_boj_metadata())
+
+        fetcher.fetch_series("boj_total_assets", "2024-01-01", "2024-06-01")
+        fetcher.fetch_series("boj_total_assets", "2024-01-01", "2024-06-02")
+        fetcher.fetch_series("boj_total_assets", "2024-01-01", "2024-06-03")
+
+        cached = sorted(path.name for path in tmp_path.rglob("*.parquet"))
+        assert cached == ["2024-01-01_2024-06-03.parquet"]
+
+class TestFetchMultiple:
+    def test_concurrent_fetch_keeps_order_and_retries_transient_errors(self, monkeypatch):
+        monkeypatch.setattr("src.etl.fetcher.time.sleep", lambda _seconds: None)
+        attempts: dict[str, int] = {}
+
+        def fake_fetch(series_id, _start=None, _end=None):
+            attempts[series_id] = attempts.get(series_id, 0) + 1
+            if series_id == "flaky" and attempts[series_id] == 1:
+                raise RuntimeError("throttled")
+            if series_id == "contract":
+                raise SourceContractError("units changed")
+            return pd.DataFrame({"value": [float(len(series_id))]})
+
+        fetcher = DataFetcher(fred_api_key="offline-test-key")
+        monkeypatch.setattr(fetcher, "fetch_series", fake_fetch)
+
+        results = fetcher.fetch_multiple(["b", "flaky", "contract", "a"], max_workers=4)
+
+        assert list(results) == ["b", "flaky", "a"]
+        assert attempts["flaky"] == 2
+        assert attempts["contract"] == 1
+
+
 class TestPeriodAndAvailabilityDates:
     def test_bis_quarter_is_dated_at_period_end(self):
         client = BISClient()
@@ -153,6 +263,61 @@ class TestPeriodAndAvailabilityDates:
         assert client._parse_period("2024-Q1") == pd.Timestamp("2024-03-31")
         assert client._parse_period("2024-Q4") == pd.Timestamp("2024-12-31")
 
+    def test_bis_sdmx_parse_dates_each_period_format(self):
+        periods = ["2024-Q1", "2024-05", "2023", "2022-06-15", "2024-Q2"]
+        payload = {
+            "data": {
+                "dataSets": [{
+                    "series": {
+                        "0:0": {
+                            "observations": {
+                                "0": ["1.5"],
+                                "1": [2],
+                                "2": [3.25],
+                                "3": [4.0],
+                                "4": [None],
+                                "9": [9.0],
+                            }
+                        }
+                    }
+                }],
+                "structure": {
+                    "dimensions": {
+                        "observation": [{
+                            "id": "TIME_PERIOD",
+                            "values": [{"id": period} for period in periods],
+                        }]
+                    }
+                },
+            }
+        }
+
+        parsed = BISClient()._parse_sdmx_json(payload)
+
+        assert parsed["date"].tolist() == [
+            pd.Timestamp("2024-03-31"),
+            pd.Timestamp("2024-05-01"),
+            pd.Timestamp("2023-01-01"),
+            pd.Timestamp("2022-06-15"),
+        ]
+        assert parsed["value"].tolist() == [1.5, 2.0, 3.25, 4.0]
+
+    def test_bis_fallback_periods_are_parsed_individually(self):
+        periods = pd.Series(
+            ["2024-Q1", "2022-06-15", "2022/09/30", "March 5, 2021", "2020-12-31T00:00:00"],
+            dtype=object,
+        )
+
+        parsed = BISClient._parse_periods(periods)
+
+        assert parsed.tolist() == [
+            pd.Timestamp("2024-03-31"),
+            pd.Timestamp("2022-06-15"),
+            pd.Timestamp("2022-09-30"),
+            pd.Timestamp("2021-03-05"),
+            pd.Timestamp("2020-12-31"),
+        ]
+
     def test_world_bank_year_is_dated_at_period_end(self):
         parsed = WorldBankClient()._parse_response(
             [
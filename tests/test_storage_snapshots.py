@@ -1,4 +1,4 @@
-"""Tests for append-only signal-vintage storage."""
+"""Tests for DataStorage: append-only signal vintages and parquet format."""
 
 import pytest
 
@@ -74,3 +74,101 @@ def test_signal_snapshot_rejects_invalid_identity_dates(
 
     with pytest.raises(ValueError, match=message):
         storage.append_signal_snapshot(snapshot)
+
+
+def test_raw_and_curated_files_are_zstd_compressed_and_round_trip(tmp_path):
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    storage = _storage(tmp_path)
+    df = pd.DataFrame({
+        "date": pd.date_range("2024-01-05", periods=4, freq="W-FRI"),
+        "value": [1.0, 2.0, 3.0, 4.0],
+    })
+
+    paths = [
+        storage.save_raw(df, "fred", "WALCL"),
+        storage.save_curated(df, "indices", "fed_net_liquidity"),
+    ]
+
+    for path in paths:
+        codec = pq.ParquetFile(path).metadata.row_group(0).column(0).compression
+        assert codec == "ZSTD"
+    pd.testing.assert_frame_equal(storage.load_raw("fred", "WALCL"), df)
+
+
+def test_load_raw_reads_only_requested_columns(tmp_path):
+    import pandas as pd
+
+    storage = _storage(tmp_path)
+    df = pd.DataFrame({
+        "date": pd.date_range("2024-01-05", periods=3, freq="W-FRI"),
+        "value": [1.0, 2.0, 3.0],
+        "series_id": "WALCL",
+        "unit": "millions_usd",
+    })
+    storage.save_raw(df, "fred", "WALCL")
+
+    loaded = storage.load_raw("fred", "WALCL", columns=["date", "value"])
+
+    assert list(loaded.columns) == ["date", "value"]
+    assert storage.get_latest_date("fred", "WALCL") == pd.Timestamp("2024-01-19")
+
+
+def test_date_range_from_footer_matches_column_read(tmp_path):
+    import pandas as pd
+
+    storage = _storage(tmp_path)
+    dates = pd.to_datetime(["2024-03-01", "2024-01-05", None, "2024-02-09"])
+    storage.save_raw(
+        pd.DataFrame({"date": dates, "value": [1.0, 2.0, 3.0, 4.0]}), "fred", "A"
+    )
+    # String dates have no temporal statistics and take the column-read path
+    storage.save_raw(
+        pd.DataFrame({"date": ["2024-01-05", "2024-03-01"], "value": [1.0, 2.0]}),
+        "fred",
+        "B",
+    )
+
+    expected = (pd.Timestamp("2024-01-05"), pd.Timestamp("2024-03-01"))
+    assert storage.get_date_range("fred", "A") == expected
+    assert storage.get_date_range("fred", "B") == expected
+    assert storage.get_latest_date("fred", "A") == pd.Timestamp("2024-03-01")
+    assert storage.get_latest_date("fred", "missing") is None
+
+
+
+def test_date_range_of_tz_aware_column_keeps_its_zone(tmp_path):
+    import pandas as pd
+
+    storage = _storage(tmp_path)
+    dates = pd.to_datetime(["2024-01-05 08:00", "2024-03-15 23:30"]).tz_localize(
+        "US/Eastern"
+    )
+    storage.save_raw(pd.DataFrame({"date": dates, "value": [1.0, 2.0]}), "fred", "A")
+
+    low, high = storage.get_date_range("fred", "A")
+
+    column = storage.load_raw("fred", "A")["date"]
+    assert (low, high) == (column.min(), column.max())
+    assert high.strftime("%Y-%m-%d") == "2024-03-15"
+    assert str(high.tz) == "US/Eastern"
+
+def test_saved_frames_are_stored_in_date_order(tmp_path):
+    import pandas as pd
+
+    storage = _storage(tmp_path)
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-19", "2024-01-05", "2024-01-05"]),
+        "value": [3.0, 1.0, 2.0],
+    })
+    storage.save_raw(df, "fred", "WALCL")
+    storage.save_curated(df, "indices", "fed_net_liquidity")
+
+    for loaded in (
+        storage.load_raw("fred", "WALCL"),
+        storage.load_curated("indices", "fed_net_liquidity"),
+    ):
+        assert loaded["date"].is_monotonic_increasing
+        # Stable: rows sharing a date keep their original order
+        assert loaded["value"].tolist() == [1.0, 2.0, 3.0]